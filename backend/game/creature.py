@@ -2,6 +2,7 @@
 
 import random
 from abc import ABC, abstractmethod
+from types import MappingProxyType
 
 
 class Creature(ABC):
@@ -10,6 +11,12 @@ class Creature(ABC):
     # Food types available in the world
     FOOD_TYPES = ['apple', 'banana', 'grapes']
     
+    # Colony membership (set for multicellular creatures, None otherwise)
+    colony = None
+    # Specialised parts (set for organisms). Read-only empty default because
+    # server.py can raise .stage on existing Cell/Multicellular objects.
+    parts = MappingProxyType({})
+    
     def __init__(self, creature_id, traits, x, y, stage=1, player_id=None, name=None):
         """
         Initialize a creature.
@@ -45,6 +52,14 @@ class Creature(ABC):
         """Serialize creature state for frontend."""
         pass
     
+    def get_position(self):
+        """Get grid position as (x, y)."""
+        return (self.x, self.y)
+    
+    def get_detection_radius(self):
+        """Get radius used for nearby-object queries."""
+        return 3
+    
     def can_evolve(self) -> bool:
         """
         Check if creature can evolve to next stage.
@@ -380,9 +380,8 @@ class Environment:
                 food_to_remove.append(food)
         
         for food in food_to_remove:
-            # Remove from spatial index
-            self.world.spatial_index.remove_object(food['id'], food['x'], food['y'])
-            self.world.food.remove(food)
+            # Remove from food list and spatial index
+            self.world.remove_food(food)
         
         # Damage creatures in flooded area
         for creature in self.world.cells:
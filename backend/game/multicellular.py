@@ -24,8 +24,7 @@ class Colony:
         """Remove a cell from the colony."""
         if cell in self.members:
             self.members.remove(cell)
-            if hasattr(cell, 'colony'):
-                del cell.colony
+            cell.colony = None
     
     def get_centroid(self):
         """Calculate centroid position of colony."""
@@ -235,7 +235,7 @@ class ResourceManager:
                 x = random.randint(0, self.world.width - 1)
                 y = random.randint(0, self.world.height - 1)
             
-            self.world.food.append({
+            self.world.add_food({
                 'x': x,
                 'y': y,
                 'id': self.world._resource_id_counter,
@@ -258,7 +258,7 @@ class ResourceManager:
                 x = random.randint(0, self.world.width - 1)
                 y = random.randint(0, self.world.height - 1)
             
-            self.world.food.append({
+            self.world.add_food({
                 'x': x,
                 'y': y,
                 'id': self.world._resource_id_counter,
@@ -158,8 +158,8 @@ class Simulation:
         
         # Get territory data
         territories_data = {}
-        for region_key, territory in self.world.territory_manager.territories.items():
-            territories_data[f"{region_key[0]},{region_key[1]}"] = territory.owner_id
+        for region_key, owner_id in self.world.territory_manager.get_territory_owners().items():
+            territories_data[f"{region_key[0]},{region_key[1]}"] = owner_id
         
         # Get disasters data
         disasters_data = []
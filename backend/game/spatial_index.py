@@ -84,22 +84,29 @@ class SpatialIndex:
         Returns:
             List of object dicts
         """
-        center_grid = self._get_grid_coords(x, y)
+        center_x, center_y = self._get_grid_coords(x, y)
         radius_cells = (radius + self.cell_size - 1) // self.cell_size
+        radius_sq = radius * radius
+        grid = self.grid
         
         nearby = []
-        for dx in range(-radius_cells, radius_cells + 1):
-            for dy in range(-radius_cells, radius_cells + 1):
-                check_grid = (center_grid[0] + dx, center_grid[1] + dy)
-                if check_grid in self.grid:
-                    for obj in self.grid[check_grid]:
-                        if obj_type is None or obj['type'] == obj_type:
-                            # Calculate actual distance
-                            dist_sq = (obj['x'] - x)**2 + (obj['y'] - y)**2
-                            if dist_sq <= radius * radius:
-                                obj_copy = obj.copy()
-                                obj_copy['dist'] = dist_sq ** 0.5
-                                nearby.append(obj_copy)
+        for grid_x in range(center_x - radius_cells, center_x + radius_cells + 1):
+            for grid_y in range(center_y - radius_cells, center_y + radius_cells + 1):
+                # .get() so empty cells are skipped without inserting into the defaultdict
+                bucket = grid.get((grid_x, grid_y))
+                if not bucket:
+                    continue
+                for obj in bucket:
+                    if obj_type is not None and obj['type'] != obj_type:
+                        continue
+                    # Compare squared distance; sqrt only for objects in range
+                    dx = obj['x'] - x
+                    dy = obj['y'] - y
+                    dist_sq = dx * dx + dy * dy
+                    if dist_sq <= radius_sq:
+                        obj_copy = obj.copy()
+                        obj_copy['dist'] = dist_sq ** 0.5
+                        nearby.append(obj_copy)
         
         return nearby
     
@@ -1,31 +1,85 @@
 """SpriteGenerator class for generating pixel art sprites using Sana API."""
 
 import os
+import io
 import aiohttp
 import aiofiles
 import hashlib
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Dict, Set, Tuple
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from PIL import Image, ImageDraw
+except ImportError:  # Pillow is optional; placeholders are skipped without it
+    Image = ImageDraw = None
+
+
+# Placeholder sprite colors, selected by prompt hash
+PLACEHOLDER_COLORS = [
+    (33, 150, 243, 255),  # Blue
+    (244, 67, 54, 255),   # Red
+    (76, 175, 80, 255),   # Green
+    (255, 235, 59, 255), # Yellow
+]
+
+# Result handed to waiters of an in-flight generation whose owning request was cancelled
+_ABANDONED = object()
+
+
+def _max_parallel_from_env() -> int:
+    """
+    Read the default generation concurrency from SPRITE_MAX_PARALLEL.
+    
+    Returns:
+        The env value, or cpu_count * 5 (calls are network-bound) if it is unset or not a number
+    """
+    default = (os.cpu_count() or 1) * 5
+    value = os.getenv('SPRITE_MAX_PARALLEL')
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        print(f"[SpriteGenerator] Ignoring non-numeric SPRITE_MAX_PARALLEL={value!r}, using {default}")
+        return default
 
 
 class SpriteGenerator:
     """Generate pixel art sprites for creatures using Sana API."""
     
-    def __init__(self, api_base_url: str = "https://sana.hanlab.ai/sprint", sprite_dir: str = "static/sprites"):
+    def __init__(
+        self,
+        api_base_url: str = "https://sana.hanlab.ai/sprint",
+        sprite_dir: str = "static/sprites",
+        max_parallel_requests: Optional[int] = None
+    ):
         """
         Initialize sprite generator.
         
         Args:
             api_base_url: Base URL for Sana API (Gradio app)
             sprite_dir: Directory to store generated sprites
+            max_parallel_requests: Max concurrent Gradio calls and pooled HTTP connections.
+                Defaults to the SPRITE_MAX_PARALLEL env var, or cpu_count * 5
         """
         self.api_base_url = api_base_url.rstrip('/')
         self.sprite_dir = Path(sprite_dir)
         self.sprite_dir.mkdir(parents=True, exist_ok=True)
         self.timeout = aiohttp.ClientTimeout(total=30)  # Gradio can take longer
-        self.executor = ThreadPoolExecutor(max_workers=2)  # For running sync Gradio client
+        if max_parallel_requests is None:
+            max_parallel_requests = _max_parallel_from_env()
+        self.max_parallel_requests = max(1, max_parallel_requests)
+        # Bounds concurrent generations so bursts wait here instead of flooding the API
+        self._semaphore = asyncio.Semaphore(self.max_parallel_requests)
+        self._session: Optional[aiohttp.ClientSession] = None  # Created lazily inside the event loop
+        self._placeholders = self._build_placeholders()
+        # Names of sprite files on disk, so existence checks don't stat the filesystem
+        self._existing_sprites: Set[str] = set()
+        self._cache_ready = False
+        self._scan_sprite_dir()
+        # In-flight generations keyed by (prompt_hash, stage) so concurrent requests share one API call
+        self._inflight: Dict[Tuple[str, int], asyncio.Future] = {}
     
     def _get_prompt_hash(self, user_prompt: str, stage: int) -> str:
         """
@@ -53,59 +107,75 @@ class SpriteGenerator:
         filename = f"{prompt_hash}_{stage}.{format}"
         return f"/static/sprites/{filename}"
     
+    def _scan_sprite_dir(self):
+        """Load the names of sprite files already on disk into the existence cache."""
+        with os.scandir(self.sprite_dir) as entries:
+            self._existing_sprites = {entry.name for entry in entries if entry.is_file()}
+        self._cache_ready = True
+    
+    def invalidate_sprite_cache(self):
+        """Force the existence cache to be rebuilt (call after removing sprite files externally)."""
+        self._cache_ready = False
+    
     def _sprite_exists(self, prompt_hash: str, stage: int, format: str = "png") -> bool:
-        """Check if sprite already exists."""
-        sprite_path = self._get_sprite_path(prompt_hash, stage, format)
-        return sprite_path.exists()
+        """Check if sprite already exists (served from the in-process cache, no stat call)."""
+        if not self._cache_ready:
+            self._scan_sprite_dir()
+        return f"{prompt_hash}_{stage}.{format}" in self._existing_sprites
+    
+    def _build_placeholders(self) -> Dict[Tuple[int, bool], bytes]:
+        """
+        Pre-render every placeholder variant as PNG bytes.
+        
+        Returns:
+            Dict mapping (color_index, has_stage_indicator) to PNG bytes
+            (empty if Pillow is unavailable)
+        """
+        if Image is None:
+            return {}
+        
+        placeholders = {}
+        try:
+            for color_index, color in enumerate(PLACEHOLDER_COLORS):
+                for has_indicator in (False, True):
+                    # Create a 64x64 image
+                    img = Image.new('RGBA', (64, 64), (0, 0, 0, 0))  # Transparent background
+                    draw = ImageDraw.Draw(img)
+                    
+                    # Draw a circle
+                    margin = 8
+                    draw.ellipse([margin, margin, 64-margin, 64-margin], fill=color)
+                    
+                    # Add stage indicator (smaller circle inside)
+                    if has_indicator:
+                        inner_margin = 20
+                        draw.ellipse([inner_margin, inner_margin, 64-inner_margin, 64-inner_margin], 
+                                   fill=(255, 255, 255, 200))
+                    
+                    # Convert to bytes
+                    img_bytes = io.BytesIO()
+                    img.save(img_bytes, format='PNG')
+                    placeholders[(color_index, has_indicator)] = img_bytes.getvalue()
+        except Exception as e:
+            print(f"[SpriteGenerator] Error creating placeholders: {e}")
+            return {}
+        return placeholders
     
     def _create_placeholder_sprite(self, prompt_hash: str, stage: int) -> Optional[bytes]:
         """
-        Create a simple placeholder sprite as fallback.
-        Returns PNG bytes of a colored square.
+        Get a simple placeholder sprite as fallback.
+        Returns PNG bytes of a colored circle, pre-rendered at startup.
         
         Args:
             prompt_hash: Hash of the prompt (used for color selection)
             stage: Evolution stage (1, 2, or 3)
         """
-        try:
-            from PIL import Image, ImageDraw
-            
-            # Create a 64x64 image
-            img = Image.new('RGBA', (64, 64), (0, 0, 0, 0))  # Transparent background
-            draw = ImageDraw.Draw(img)
-            
-            # Draw a simple colored circle/square based on prompt hash
-            colors = [
-                (33, 150, 243, 255),  # Blue
-                (244, 67, 54, 255),   # Red
-                (76, 175, 80, 255),   # Green
-                (255, 235, 59, 255), # Yellow
-            ]
-            # Use hash to select color consistently
-            hash_int = int(prompt_hash, 16)
-            color = colors[hash_int % len(colors)]
-            
-            # Draw a circle
-            margin = 8
-            draw.ellipse([margin, margin, 64-margin, 64-margin], fill=color)
-            
-            # Add stage indicator (smaller circle inside)
-            if stage > 1:
-                inner_margin = 20
-                draw.ellipse([inner_margin, inner_margin, 64-inner_margin, 64-inner_margin], 
-                           fill=(255, 255, 255, 200))
-            
-            # Convert to bytes
-            import io
-            img_bytes = io.BytesIO()
-            img.save(img_bytes, format='PNG')
-            return img_bytes.getvalue()
-        except ImportError:
+        if not self._placeholders:
             print(f"[SpriteGenerator] PIL/Pillow not available for placeholder sprites")
             return None
-        except Exception as e:
-            print(f"[SpriteGenerator] Error creating placeholder: {e}")
-            return None
+        # Use hash to select color consistently
+        color_index = int(prompt_hash, 16) % len(PLACEHOLDER_COLORS)
+        return self._placeholders[(color_index, stage > 1)]
     
     def _create_prompt(self, user_prompt: str, stage: int) -> str:
         """
@@ -128,16 +198,66 @@ class SpriteGenerator:
         prompt = f"pixel art sprite, {stage_desc}, {user_prompt}, 64x64 pixels, simple style, game character, top-down view, transparent background"
         return prompt
     
-    def _generate_sprite_sync(self, api_prompt: str) -> Optional[bytes]:
+    def _extract_image_ref(self, result) -> Optional[Dict[str, str]]:
+        """
+        Locate the generated image in a Gradio /run result.
+        
+        Args:
+            result: Result sequence from the /run endpoint (gradio_client tuple or HTTP 'data' list)
+            
+        Returns:
+            {'url': ...} or {'path': ...} for the generated image, or None if not found
+        """
+        print(f"[SpriteGenerator] API returned result type: {type(result)}")
+        print(f"[SpriteGenerator] Result length: {len(result) if result else 0}")
+        
+        # Result is a tuple: (images, seed, value_10, value_4)
+        # images is a list of dicts with image data
+        if result and len(result) > 0:
+            images = result[0]
+            print(f"[SpriteGenerator] Images type: {type(images)}, length: {len(images) if images else 0}")
+            
+            if images and len(images) > 0:
+                image_data = images[0]
+                print(f"[SpriteGenerator] Image data type: {type(image_data)}")
+                print(f"[SpriteGenerator] Image data: {str(image_data)[:200]}...")
+                
+                # Image dict has 'image' key with 'url' or 'path'
+                if isinstance(image_data, dict):
+                    img_info = image_data.get('image', {})
+                    print(f"[SpriteGenerator] Image info type: {type(img_info)}")
+                    
+                    if isinstance(img_info, dict):
+                        # Try to get image URL or path
+                        image_url = img_info.get('url')
+                        image_path = img_info.get('path')
+                        
+                        print(f"[SpriteGenerator] Image URL: {image_url}, Path: {image_path}")
+                        
+                        if image_url:
+                            return {'url': image_url}
+                        elif image_path:
+                            return {'path': image_path}
+                    elif isinstance(img_info, str):
+                        # Might be a direct file path
+                        print(f"[SpriteGenerator] Image info is string (path): {img_info}")
+                        return {'path': img_info}
+        
+        print(f"[SpriteGenerator] ✗ No image data found in API response")
+        print(f"[SpriteGenerator] Full result structure: {result}")
+        return None
+    
+    def _invoke_gradio_sync(self, api_prompt: str) -> Optional[Dict[str, str]]:
         """
-        Synchronously generate sprite using Gradio client.
-        This runs in a thread pool to avoid blocking.
+        Synchronously call the Gradio API through gradio_client.
+        Only used as a fallback when the direct HTTP call is rejected; it runs
+        in a worker thread via asyncio.to_thread to avoid blocking.
         
         Args:
             api_prompt: Formatted prompt for image generation
             
         Returns:
-            Image bytes or None if generation fails
+            {'url': ...} or {'path': ...} for the generated image, or None if generation fails
         """
         try:
             from gradio_client import Client
@@ -177,62 +297,7 @@ class SpriteGenerator:
                 else:
                     raise
             
-            print(f"[SpriteGenerator] API returned result type: {type(result)}")
-            print(f"[SpriteGenerator] Result length: {len(result) if result else 0}")
-            
-            # Result is a tuple: (images, seed, value_10, value_4)
-            # images is a list of dicts with image data
-            if result and len(result) > 0:
-                images = result[0]
-                print(f"[SpriteGenerator] Images type: {type(images)}, length: {len(images) if images else 0}")
-                
-                if images and len(images) > 0:
-                    image_data = images[0]
-                    print(f"[SpriteGenerator] Image data type: {type(image_data)}")
-                    print(f"[SpriteGenerator] Image data: {str(image_data)[:200]}...")
-                    
-                    # Image dict has 'image' key with 'url' or 'path'
-                    if isinstance(image_data, dict):
-                        img_info = image_data.get('image', {})
-                        print(f"[SpriteGenerator] Image info type: {type(img_info)}")
-                        
-                        if isinstance(img_info, dict):
-                            # Try to get image URL or path
-                            image_url = img_info.get('url')
-                            image_path = img_info.get('path')
-                            
-                            print(f"[SpriteGenerator] Image URL: {image_url}, Path: {image_path}")
-                            
-                            if image_url:
-                                print(f"[SpriteGenerator] Downloading image from URL: {image_url}")
-                                # Download image from URL
-                                import requests
-                                response = requests.get(image_url, timeout=30)
-                                if response.status_code == 200:
-                                    print(f"[SpriteGenerator] ✓ Downloaded {len(response.content)} bytes")
-                                    return response.content
-                                else:
-                                    print(f"[SpriteGenerator] ✗ Download failed: {response.status_code}")
-                            elif image_path:
-                                print(f"[SpriteGenerator] Reading image from path: {image_path}")
-                                # Read from local path
-                                if os.path.exists(image_path):
-                                    with open(image_path, 'rb') as f:
-                                        data = f.read()
-                                        print(f"[SpriteGenerator] ✓ Read {len(data)} bytes from file")
-                                        return data
-                                else:
-                                    print(f"[SpriteGenerator] ✗ File does not exist: {image_path}")
-                        elif isinstance(img_info, str):
-                            # Might be a direct file path
-                            print(f"[SpriteGenerator] Image info is string (path): {img_info}")
-                            if os.path.exists(img_info):
-                                with open(img_info, 'rb') as f:
-                                    return f.read()
-            
-            print(f"[SpriteGenerator] ✗ No image data found in API response")
-            print(f"[SpriteGenerator] Full result structure: {result}")
-            return None
+            return self._extract_image_ref(result)
             
         except ImportError:
             print(f"[SpriteGenerator] ✗ gradio_client not installed. Run: pip install gradio_client")
@@ -246,6 +311,109 @@ class SpriteGenerator:
             traceback.print_exc()
             return None
     
+    async def _invoke_gradio_async(self, api_prompt: str) -> Optional[Dict[str, str]]:
+        """
+        Call the Gradio /run endpoint directly over HTTP.
+        Falls back to gradio_client if the endpoint rejects the request
+        (e.g. parameter choices changed on the server).
+        
+        Args:
+            api_prompt: Formatted prompt for image generation
+            
+        Returns:
+            {'url': ...} for the generated image ({'path': ...} if the gradio_client
+            fallback produced it), or None if generation fails
+        """
+        # Positional inputs of the /run endpoint, same order as the gradio_client call
+        payload = {
+            "data": [
+                api_prompt,
+                "Pixel art",  # style
+                1,  # num_imgs
+                0,  # seed
+                64,  # height
+                64,  # width
+                4.5,  # guidance_scale
+                2,  # num_inference_steps
+                "1.5708",  # max_timesteps (must be string)
+                "1.3",  # intermediate_timesteps (must be string)
+                None,  # timesteps
+                True,  # randomize_seed
+                True,  # use_resolution_binning
+            ]
+        }
+        try:
+            print(f"[SpriteGenerator] Calling /run API with prompt: {api_prompt[:100]}...")
+            session = await self._get_session()
+            async with session.post(f"{self.api_base_url}/api/run", json=payload) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    if isinstance(data, dict):
+                        image_ref = self._extract_image_ref(data.get('data'))
+                        if image_ref and 'path' in image_ref:
+                            # Paths in the HTTP response are on the Gradio server, not local files
+                            image_ref = {'url': f"{self.api_base_url}/file={image_ref['path']}"}
+                        return image_ref
+                    print(f"[SpriteGenerator] /run API returned unexpected body: {str(data)[:200]}")
+                else:
+                    error_text = await response.text()
+                    print(f"[SpriteGenerator] /run API error {response.status}: {error_text[:200]}")
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"[SpriteGenerator] ✗ Error calling Gradio API ({type(e).__name__}): {e}")
+            return None
+        
+        print("[SpriteGenerator] Retrying with gradio_client")
+        return await asyncio.to_thread(self._invoke_gradio_sync, api_prompt)
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it on first use inside the event loop."""
+        if self._session is None or self._session.closed:
+            # Pooled keep-alive connections and cached DNS across all sprite requests.
+            # Sized from the same setting as self._semaphore so neither caps the other
+            connector = aiohttp.TCPConnector(limit=self.max_parallel_requests, ttl_dns_cache=300)
+            self._session = aiohttp.ClientSession(timeout=self.timeout, connector=connector)
+        return self._session
+    
+    async def close(self):
+        """Close the shared HTTP session."""
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    async def _fetch_image_async(self, image_ref: Dict[str, str]) -> Optional[bytes]:
+        """
+        Fetch generated image bytes without holding a thread pool worker.
+        
+        Args:
+            image_ref: {'url': ...} or {'path': ...}; paths only come from gradio_client,
+                which downloads the image to a local file
+            
+        Returns:
+            Image bytes or None if the image could not be fetched
+        """
+        image_url = image_ref.get('url')
+        if image_url:
+            print(f"[SpriteGenerator] Downloading image from URL: {image_url}")
+            session = await self._get_session()
+            async with session.get(image_url) as response:
+                if response.status == 200:
+                    data = await response.read()
+                    print(f"[SpriteGenerator] ✓ Downloaded {len(data)} bytes")
+                    return data
+                print(f"[SpriteGenerator] ✗ Download failed: {response.status}")
+                return None
+        
+        image_path = image_ref.get('path')
+        if image_path:
+            print(f"[SpriteGenerator] Reading image from path: {image_path}")
+            if os.path.exists(image_path):
+                async with aiofiles.open(image_path, 'rb') as f:
+                    data = await f.read()
+                print(f"[SpriteGenerator] ✓ Read {len(data)} bytes from file")
+                return data
+            print(f"[SpriteGenerator] ✗ File does not exist: {image_path}")
+        return None
+    
     async def generate_sprite(
         self, 
         user_prompt: str, 
@@ -273,6 +441,50 @@ class SpriteGenerator:
             print(f"[SpriteGenerator] Using cached sprite for prompt hash {prompt_hash} stage {stage}")
             return self._get_sprite_url(prompt_hash, stage)
         
+        # Join an identical generation that is already running instead of starting another
+        key = (prompt_hash, stage)
+        pending = self._inflight.get(key)
+        if pending is not None:
+            print(f"[SpriteGenerator] Waiting for in-flight generation of prompt hash {prompt_hash} stage {stage}")
+            sprite_url = await asyncio.shield(pending)
+            if sprite_url is _ABANDONED:
+                # The request that started it was cancelled; start over or join a newer attempt
+                return await self.generate_sprite(user_prompt, creature_id, stage, force_regenerate)
+            return sprite_url
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            sprite_url = await self._generate_and_save(user_prompt, creature_id, stage, prompt_hash)
+            future.set_result(sprite_url)
+            return sprite_url
+        except BaseException:
+            # Only cancellation gets here. It belongs to this request alone, so waiters
+            # get a retry marker instead of a CancelledError they never asked for
+            future.set_result(_ABANDONED)
+            raise
+        finally:
+            del self._inflight[key]
+    
+    async def _generate_and_save(
+        self,
+        user_prompt: str,
+        creature_id: int,
+        stage: int,
+        prompt_hash: str
+    ) -> Optional[str]:
+        """
+        Generate a sprite via the API (or placeholder) and save it to disk.
+        
+        Args:
+            user_prompt: User's original creature description
+            creature_id: Unique creature identifier (used for logging only)
+            stage: Evolution stage (1, 2, or 3)
+            prompt_hash: Precomputed prompt hash for file naming
+            
+        Returns:
+            Sprite URL path or None if generation fails
+        """
         try:
             # Format prompt for API
             api_prompt = self._create_prompt(user_prompt, stage)
@@ -281,14 +493,11 @@ class SpriteGenerator:
             print(f"[SpriteGenerator] API prompt: {api_prompt[:100]}...")
             print(f"[SpriteGenerator] API base URL: {self.api_base_url}")
             
-            # Call Sana API using Gradio client
-            # Run sync Gradio client in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
-            sprite_data = await loop.run_in_executor(
-                self.executor,
-                self._generate_sprite_sync,
-                api_prompt
-            )
+            # Call Sana API (Gradio app) directly over the shared HTTP session. The download
+            # holds the same slot, so open connections never outnumber semaphore slots
+            async with self._semaphore:
+                image_ref = await self._invoke_gradio_async(api_prompt)
+                sprite_data = await self._fetch_image_async(image_ref) if image_ref else None
             
             if not sprite_data:
                 print(f"[SpriteGenerator] ✗ Failed to generate sprite with Gradio API")
@@ -305,10 +514,12 @@ class SpriteGenerator:
             async with aiofiles.open(sprite_path, 'wb') as f:
                 await f.write(sprite_data)
             
+            self._existing_sprites.add(sprite_path.name)
+            
             print(f"[SpriteGenerator] ✓ Sprite saved to {sprite_path}")
             return self._get_sprite_url(prompt_hash, stage)
                 
-        except aiohttp.ClientTimeout:
+        except asyncio.TimeoutError:
             print(f"[SpriteGenerator] ✗ Timeout generating sprite (exceeded {self.timeout.total}s)")
             print(f"[SpriteGenerator] → Falling back gracefully (creature will use canvas drawing)")
             return None
@@ -350,9 +561,8 @@ class SpriteGenerator:
             Sprite URL path if preview sprite exists, None otherwise
         """
         prompt_hash = self._get_preview_prompt_hash(user_prompt, stage)
-        sprite_path = self._get_sprite_path(prompt_hash, stage)
         
-        if sprite_path.exists():
+        if self._sprite_exists(prompt_hash, stage):
             print(f"[SpriteGenerator] ✓ Preview sprite exists for prompt hash {prompt_hash} stage {stage}")
             return self._get_sprite_url(prompt_hash, stage)
         
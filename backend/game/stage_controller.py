@@ -26,7 +26,8 @@ class StageController:
             stage_number: Stage number (1, 2, or 3)
         """
         self.current_stage = stage_number
-        self.stage_start_time = time.time()
+        # Monotonic clock: unaffected by wall-clock (NTP) adjustments
+        self.stage_start_time = time.perf_counter()
         self.stage_ended = False
     
     def get_time_remaining(self):
@@ -39,7 +40,7 @@ class StageController:
         if self.stage_start_time is None:
             return self.stage_duration
         
-        elapsed = time.time() - self.stage_start_time
+        elapsed = time.perf_counter() - self.stage_start_time
         remaining = max(0, self.stage_duration - elapsed)
         
         if remaining <= 0 and not self.stage_ended:
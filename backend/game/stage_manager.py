@@ -51,7 +51,7 @@ class StageManager:
                 new_creature.sprite_url = creature.sprite_url
             
             # Replace in world
-            world.cells = [c if c.id != creature.id else new_creature for c in world.cells]
+            world.replace_cell(creature, new_creature)
             return new_creature
         
         elif creature.stage == 2:
@@ -75,7 +75,7 @@ class StageManager:
                     creature.colony.remove_member(creature)
                 
                 # Replace in world
-                world.cells = [c if c.id != creature.id else new_creature for c in world.cells]
+                world.replace_cell(creature, new_creature)
                 
                 # Scale world if needed
                 StageManager.scale_world_for_stage(world, stage=3)
@@ -16,11 +16,9 @@ class StageResults:
         Returns:
             Dict with results for the player
         """
-        # Get creatures for the player
-        player_creatures = [c for c in world.cells if c.alive and c.player_id == player_id]
-        
-        # Get primary creature (should be only 1, but take first if multiple)
-        player_creature = player_creatures[0] if player_creatures else None
+        # Get primary creature: first alive creature of the player (should be only 1)
+        # Only the player's own creatures are scanned, via the world's per-player index
+        player_creature = next((c for c in world.cells_by_player.get(player_id, ()) if c.alive), None)
         
         # Calculate stats for the player
         player_stats = StageResults._calculate_player_stats(player_creature, player_id)
@@ -49,8 +47,7 @@ class StageResults:
                 'alive': False,
                 'energy': 0,
                 'age': 0,
-                'stage': 0,
-                'survival': False
+                'stage': 0
             }
         
         return {
@@ -59,7 +56,6 @@ class StageResults:
             'energy': creature.energy,
             'age': creature.age,
             'stage': creature.stage,
-            'survival': creature.alive,
             'color': creature.color,
             'speed': creature.speed,
             'diet': creature.diet,
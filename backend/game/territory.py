@@ -1,72 +1,79 @@
 """Territory system for creature territory claiming and management."""
 
-from typing import Dict, Tuple, Optional, List
+from typing import Dict, Tuple, Optional, List, Set
 
 
-class Territory:
-    """Represents a claimed territory region."""
+class TerritoryManager:
+    """Manages territory claiming and access."""
     
-    def __init__(self, region_key: Tuple[int, int], owner_id: int):
+    def __init__(self, world):
         """
-        Initialize a territory.
+        Initialize territory manager.
         
         Args:
-            region_key: (region_x, region_y) tuple
-            owner_id: ID of creature that owns this territory
+            world: World instance
         """
-        self.region_key = region_key
-        self.owner_id = owner_id
-        self.defense_strength = 1.0  # Territory defense modifier
+        self.world = world
+        # (region_x, region_y) -> (owner_id, defense_strength)
+        self.territories: Dict[Tuple[int, int], Tuple[int, float]] = {}
+        # Reverse index: owner_id -> region keys, kept in sync with self.territories
+        self._by_owner: Dict[int, Set[Tuple[int, int]]] = {}
     
-    def can_access(self, creature_id: int) -> bool:
+    def claim_territory(self, region_key: Tuple[int, int], creature_id: int) -> bool:
         """
-        Check if creature can access this territory.
+        Claim a territory region.
         
         Args:
-            creature_id: ID of creature trying to access
+            region_key: (region_x, region_y) tuple
+            creature_id: ID of creature claiming
             
         Returns:
-            True if creature can access (owner or unclaimed)
+            True if successfully claimed
         """
-        return self.owner_id == creature_id or self.owner_id is None
-
-
-class TerritoryManager:
-    """Manages territory claiming and access."""
+        return self._claim(region_key, creature_id, self.world.cells_by_id)
     
-    def __init__(self, world):
+    def claim_territory_batch(self, claims: List[Tuple[Tuple[int, int], int]]) -> List[bool]:
         """
-        Initialize territory manager.
+        Claim several territory regions in one call.
+        Same rules as claim_territory, applied in order.
         
         Args:
-            world: World instance
+            claims: List of (region_key, creature_id) tuples
+            
+        Returns:
+            List of booleans, True for each successful claim
         """
-        self.world = world
-        self.territories: Dict[Tuple[int, int], Territory] = {}
+        cells_by_id = self.world.cells_by_id
+        return [self._claim(region_key, creature_id, cells_by_id) for region_key, creature_id in claims]
     
-    def claim_territory(self, region_key: Tuple[int, int], creature_id: int) -> bool:
+    def _claim(self, region_key: Tuple[int, int], creature_id: int, cells_by_id) -> bool:
         """
-        Claim a territory region.
+        Claim rules shared by claim_territory and claim_territory_batch.
         
         Args:
             region_key: (region_x, region_y) tuple
             creature_id: ID of creature claiming
+            cells_by_id: Creature lookup used to check whether the current owner is alive
             
         Returns:
             True if successfully claimed
         """
-        if region_key in self.territories:
+        existing = self.territories.get(region_key)
+        if existing is not None:
             # Territory already claimed - can only be claimed by owner or if owner is dead
-            existing = self.territories[region_key]
-            if existing.owner_id == creature_id:
+            existing_owner_id = existing[0]
+            if existing_owner_id == creature_id:
                 return True  # Already owned by this creature
             # Check if owner is dead
-            owner = next((c for c in self.world.cells if c.id == existing.owner_id), None)
+            owner = cells_by_id.get(existing_owner_id)
             if owner and owner.alive:
                 return False  # Territory is defended
+            # Previous owner is dead - drop it from the reverse index
+            self._unindex_owner(existing_owner_id, region_key)
         
-        # Claim territory
-        self.territories[region_key] = Territory(region_key, creature_id)
+        # Claim territory (default defense strength 1.0)
+        self.territories[region_key] = (creature_id, 1.0)
+        self._by_owner.setdefault(creature_id, set()).add(region_key)
         return True
     
     def get_territory_owner(self, region_key: Tuple[int, int]) -> Optional[int]:
@@ -80,7 +87,7 @@ class TerritoryManager:
             Creature ID if claimed, None otherwise
         """
         territory = self.territories.get(region_key)
-        return territory.owner_id if territory else None
+        return territory[0] if territory else None
     
     def can_access_territory(self, region_key: Tuple[int, int], creature_id: int) -> bool:
         """
@@ -94,9 +101,8 @@ class TerritoryManager:
             True if can access
         """
         territory = self.territories.get(region_key)
-        if not territory:
-            return True  # Unclaimed territory is accessible
-        return territory.can_access(creature_id)
+        # Unclaimed territory is accessible
+        return territory is None or territory[0] == creature_id or territory[0] is None
     
     def release_territory(self, region_key: Tuple[int, int]):
         """
@@ -105,8 +111,22 @@ class TerritoryManager:
         Args:
             region_key: (region_x, region_y) tuple
         """
-        if region_key in self.territories:
-            del self.territories[region_key]
+        territory = self.territories.pop(region_key, None)
+        if territory:
+            self._unindex_owner(territory[0], region_key)
+    
+    def _unindex_owner(self, owner_id: int, region_key: Tuple[int, int]):
+        """
+        Remove a region from an owner's reverse-index entry, dropping the entry once empty.
+        
+        Args:
+            owner_id: ID of the creature that owned the region
+            region_key: (region_x, region_y) tuple
+        """
+        owned = self._by_owner[owner_id]
+        owned.discard(region_key)
+        if not owned:
+            del self._by_owner[owner_id]
     
     def get_creature_territories(self, creature_id: int) -> List[Tuple[int, int]]:
         """
@@ -116,8 +136,16 @@ class TerritoryManager:
             creature_id: ID of creature
             
         Returns:
-            List of region keys
+            List of region keys, sorted by (region_x, region_y)
+        """
+        return sorted(self._by_owner.get(creature_id, ()))
+    
+    def get_territory_owners(self) -> Dict[Tuple[int, int], int]:
+        """
+        Get the owner of every claimed territory.
+        
+        Returns:
+            Dict mapping (region_x, region_y) to owner creature ID
         """
-        return [key for key, territory in self.territories.items() 
-                if territory.owner_id == creature_id]
+        return {key: territory[0] for key, territory in self.territories.items()}
 
@@ -1,7 +1,74 @@
 """World class managing game state, creatures, and resources."""
 
+import heapq
+import logging
 import random
-import math
+from collections import defaultdict
+from operator import itemgetter
+
+from .cell import Cell
+from .multicellular import Multicellular
+from .organism import Organism
+
+# Debug output for the simulation loop. Enabling DEBUG for this logger prints several
+# lines per creature per turn and slows the simulation down considerably.
+logger = logging.getLogger(__name__)
+
+# Display names indexed by creature stage (1-3)
+_STAGE_NAMES = ("", "Cell", "Multicellular", "Organism")
+# Creature class to instantiate for offspring, indexed by stage (1-3)
+_STAGE_CLASSES = (None, Cell, Multicellular, Organism)
+
+# Sort key for get_nearby results
+_by_dist = itemgetter('dist')
+# A tile followed by its 8 neighbours, for probing position-keyed maps
+_NEIGHBOR_OFFSETS = ((0, 0), (-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
+
+
+class _TurnContext:
+    """Per-call state shared by the update_cells action handlers."""
+    
+    __slots__ = ('events', 'detailed_events', 'occupancy', 'max_x', 'max_y')
+    
+    def __init__(self, occupancy, max_x, max_y):
+        self.events = []  # Event strings for display
+        self.detailed_events = []  # Event dicts for scoring
+        self.occupancy = occupancy  # {(x, y): [creature, ...]}, kept in sync on moves/births
+        self.max_x = max_x  # Grid bounds used to clamp every move
+        self.max_y = max_y
+
+
+# Stderr handler installed by set_debug_logging, or None
+_debug_handler = None
+
+
+def set_debug_logging(enabled):
+    """
+    Turn DEBUG output for this module on or off.
+    
+    This is process-wide: the setting applies to the module logger, so it affects
+    every World instance, not only the one created with debug=True. Calling it
+    again with the same value is a no-op; set_debug_logging(False) undoes it.
+    
+    Args:
+        enabled: True to log at DEBUG level, False to restore the default level
+    """
+    global _debug_handler
+    if enabled:
+        logger.setLevel(logging.DEBUG)
+        # Only add our own handler when nothing else would print the records; it stops
+        # propagation so a root handler configured later doesn't print them twice
+        if _debug_handler is None and not logging.getLogger().handlers:
+            _debug_handler = logging.StreamHandler()
+            _debug_handler.setFormatter(logging.Formatter("[DEBUG] %(message)s"))
+            logger.addHandler(_debug_handler)
+            logger.propagate = False
+    else:
+        logger.setLevel(logging.NOTSET)
+        if _debug_handler is not None:
+            logger.removeHandler(_debug_handler)
+            logger.propagate = True
+            _debug_handler = None
 
 
 class World:
@@ -15,7 +82,7 @@ class World:
         'grapes': '🍇'
     }
 
-    def __init__(self, width=20, height=20, food_type_config=None):
+    def __init__(self, width=20, height=20, food_type_config=None, debug=False):
         """
         Initialize the world.
         
@@ -24,17 +91,32 @@ class World:
             height: Grid height
             food_type_config: Optional dict with food type configuration to reuse.
                             If None, generates a new random configuration.
+            debug: If True, enable DEBUG output (per-creature action traces, food
+                   summaries) via set_debug_logging. This is process-wide and stays on
+                   for later World instances until set_debug_logging(False) is called.
+                   Leaves logging configuration untouched otherwise.
         """
+        if debug:
+            set_debug_logging(True)
         self.width = width
         self.height = height
         self.cells = []  # List of Creature objects (Cell, Multicellular, Organism)
+        self.cell_index = {}  # {creature_id: index in self.cells}
+        self.cells_by_id = {}  # {creature_id: creature}
+        self.cells_by_player = {}  # {player_id: [creature, ...]} in insertion order
         self.food = []   # [{x, y, id, type}, ...]
+        self._food_by_id = {}  # {resource_id: food item}, kept in sync by add_food/remove_food
+        self._food_by_pos = {}  # {(x, y): [food item, ...]}, kept in sync the same way
         self.light = []
         self.turn = 0
         self._resource_id_counter = 1000  # Start IDs high to avoid conflicts
         self.max_stage = 1  # Track highest stage present
         # Track unique energy events per attempt: set of (action, object, energy_change) tuples
         self.energy_events = set()
+        # (events set, size, formatted list) from the last get_energy_events_list call
+        self._energy_events_cache = (None, 0, [])
+        # Actions decided by Environment for NPC predators, merged into the next update_cells call
+        self._predator_actions = {}
         
         # Regional food density: divide world into regions with different densities
         # Regions are 5x5 cells by default
@@ -55,6 +137,22 @@ class World:
         self.social_system = SocialSystem(self)
         self.environment = Environment(self, llm_parser=None)  # llm_parser will be set from server
         
+        # update_cells dispatch table: action type -> handler. Handlers return True when the
+        # action ends the creature's turn early (no death check or aging that turn).
+        self._action_handlers = {
+            'move': self._do_move,
+            'hide': self._do_hide,
+            'drink': self._do_drink,
+            'eat': self._do_eat,
+            'flee': self._do_flee,
+            'attack': self._do_attack,
+            'reproduce': self._do_reproduce,
+            'signal': self._do_signal,
+            'claim': self._do_claim,
+            'cooperate': self._do_cooperate,
+            'migrate': self._do_migrate,
+        }
+        
         # Spatial index for performance
         from .spatial_index import SpatialIndex
         self.spatial_index = SpatialIndex(width, height, cell_size=5)
@@ -66,12 +164,12 @@ class World:
         # If provided, reuse existing config; otherwise generate new random config
         if food_type_config is not None:
             self.food_type_config = food_type_config.copy()  # Use provided config
-            print(f"[DEBUG] Food Type Configuration (reused from game start):")
+            logger.debug("Food Type Configuration (reused from game start):")
         else:
             # Each food type gets a random base energy value (25-35 range for similarity)
             # One type will be randomly selected as lethal
             # Each type will be randomly assigned as positive (adds energy) or negative (removes energy)
-            self.food_type_config = {}
+            new_config = {}
             lethal_type = random.choice(self.FOOD_TYPES)
             
             for food_type in self.FOOD_TYPES:
@@ -79,18 +177,34 @@ class World:
                 is_positive = random.choice([True, False])
                 is_lethal = (food_type == lethal_type)
                 
-                self.food_type_config[food_type] = {
+                new_config[food_type] = {
                     'base_energy': base_energy,
                     'is_positive': is_positive,
                     'is_lethal': is_lethal
                 }
-            print(f"[DEBUG] Food Type Configuration (new game):")
+            self.food_type_config = new_config
+            logger.debug("Food Type Configuration (new game):")
         
         # Log the food type configuration
         for food_type, config in self.food_type_config.items():
             effect = "adds" if config['is_positive'] else "removes"
             lethal = " (LETHAL)" if config['is_lethal'] else ""
-            print(f"[DEBUG]   {food_type}: base_energy={config['base_energy']}, {effect} energy{lethal}")
+            logger.debug("  %s: base_energy=%s, %s energy%s", food_type, config['base_energy'], effect, lethal)
+
+    @property
+    def food_type_config(self):
+        """Per food type config: {type: {'base_energy', 'is_positive', 'is_lethal'}}."""
+        return self._food_type_config
+
+    @food_type_config.setter
+    def food_type_config(self, config):
+        # Flattened (base_energy, is_positive, is_lethal) per type for the spawn/eat paths.
+        # Rebuilt on assignment, e.g. when the server restores the config for a new attempt.
+        self._food_type_config = config
+        self._food_type_props = {
+            food_type: (cfg['base_energy'], cfg['is_positive'], cfg['is_lethal'])
+            for food_type, cfg in config.items()
+        }
 
     def _initialize_regions(self):
         """Initialize regional food density map with varying densities."""
@@ -105,7 +219,15 @@ class World:
                 density = random.uniform(0.3, 1.5)
                 self.regions[(rx, ry)] = density
         
-        print(f"[DEBUG] Initialized {num_regions_x * num_regions_y} regions with varying food densities")
+        # Per-tile lookup table so get_region_density is a plain index
+        span_x = num_regions_x * self.region_size
+        span_y = num_regions_y * self.region_size
+        self._density_grid = [
+            [self.regions[(x // self.region_size, y // self.region_size)] for x in range(span_x)]
+            for y in range(span_y)
+        ]
+        
+        logger.debug("Initialized %s regions with varying food densities", num_regions_x * num_regions_y)
     
     def get_region_density(self, x, y):
         """
@@ -118,23 +240,139 @@ class World:
         Returns:
             Density multiplier (0.3 to 1.5)
         """
-        region_x = x // self.region_size
-        region_y = y // self.region_size
-        return self.regions.get((region_x, region_y), 1.0)
+        grid = self._density_grid
+        if 0 <= y < len(grid):
+            row = grid[y]
+            if 0 <= x < len(row):
+                return row[x]
+        return 1.0
 
     def add_cell(self, creature):
         """Add creature to world (works for Cell, Multicellular, Organism)."""
+        self.cell_index[creature.id] = len(self.cells)
         self.cells.append(creature)
+        self.cells_by_id[creature.id] = creature
+        self.cells_by_player.setdefault(creature.player_id, []).append(creature)
         # Update max stage
-        if hasattr(creature, 'stage'):
-            self.max_stage = max(self.max_stage, creature.stage)
+        self.max_stage = max(self.max_stage, creature.stage)
         # Add to spatial index
-        if hasattr(creature, 'get_position'):
-            pos_x, pos_y = creature.get_position()
-        else:
-            pos_x, pos_y = creature.x, creature.y
+        pos_x, pos_y = creature.get_position()
         self.spatial_index.add_object(creature.id, pos_x, pos_y, 'creature')
 
+    def replace_cell(self, creature, new_creature):
+        """
+        Swap a creature for its replacement in place (e.g. after evolution).
+        
+        Args:
+            creature: Creature currently in the world
+            new_creature: Replacement creature (keeps the same ID and position)
+        """
+        index = self.cell_index.pop(creature.id)
+        self.cells[index] = new_creature
+        self.cell_index[new_creature.id] = index
+        del self.cells_by_id[creature.id]
+        self.cells_by_id[new_creature.id] = new_creature
+        player_cells = self.cells_by_player[creature.player_id]
+        player_cells[player_cells.index(creature)] = new_creature
+
+    def add_food(self, food_item):
+        """
+        Add a resource item (food, water, shelter) to the world.
+        
+        Args:
+            food_item: Dict with at least x, y, id and type
+        """
+        self.food.append(food_item)
+        self._food_by_id[food_item['id']] = food_item
+        self._food_by_pos.setdefault((food_item['x'], food_item['y']), []).append(food_item)
+
+    def remove_food(self, food_item):
+        """
+        Remove a resource item from the world and the spatial index.
+        
+        Args:
+            food_item: Item previously added with add_food
+        """
+        self.spatial_index.remove_object(food_item['id'], food_item['x'], food_item['y'])
+        self.food.remove(food_item)
+        self._food_by_id.pop(food_item['id'], None)
+        pos = (food_item['x'], food_item['y'])
+        items = self._food_by_pos.get(pos)
+        if items and food_item in items:
+            items.remove(food_item)
+            if not items:
+                del self._food_by_pos[pos]
+
+    def _find_resource(self, resource_id, resource_type=None):
+        """
+        Look up a resource item by ID.
+        
+        Args:
+            resource_id: Resource ID
+            resource_type: Optional type the item must have (e.g. 'shelter')
+            
+        Returns:
+            Food item dict or None
+        """
+        item = self._food_by_id.get(resource_id)
+        if item is None or (resource_type is not None and item.get('type') != resource_type):
+            return None
+        return item
+
+    def _find_adjacent_resource(self, x, y, resource_type=None):
+        """
+        Find a resource item on (x, y) or one of its 8 neighbours.
+        
+        Args:
+            x: X coordinate
+            y: Y coordinate
+            resource_type: Optional type the item must have (e.g. 'water')
+            
+        Returns:
+            The matching item that was added first (lowest ID, i.e. earliest in
+            self.food), or None
+        """
+        best = None
+        food_by_pos = self._food_by_pos
+        for dx, dy in _NEIGHBOR_OFFSETS:
+            for item in food_by_pos.get((x + dx, y + dy), ()):
+                if resource_type is not None and item.get('type') != resource_type:
+                    continue
+                if best is None or item['id'] < best['id']:
+                    best = item
+        return best
+
+    def _build_occupancy(self):
+        """
+        Map grid positions to the living creatures standing on them.
+        
+        Returns:
+            Dict of {(x, y): [creature, ...]}
+        """
+        occupancy = {}
+        for c in self.cells:
+            if c.alive:
+                occupancy.setdefault((c.x, c.y), []).append(c)
+        return occupancy
+
+    @staticmethod
+    def _is_occupied(occupancy, x, y, exclude=None):
+        """Check whether a living creature other than `exclude` stands at (x, y)."""
+        for other in occupancy.get((x, y), ()):
+            if other.alive and other is not exclude:
+                return True
+        return False
+
+    @staticmethod
+    def _relocate(occupancy, creature, new_x, new_y):
+        """Move a creature to (new_x, new_y) and keep the occupancy map in sync."""
+        bucket = occupancy.get((creature.x, creature.y))
+        if bucket and creature in bucket:
+            bucket.remove(creature)
+        occupancy.setdefault((new_x, new_y), []).append(creature)
+        creature.x = new_x
+        creature.y = new_y
+
     def _get_allowed_food_types_for_biome(self, biome):
         """
         Get list of food types allowed in a given biome.
@@ -176,17 +414,24 @@ class World:
         
         # Spawn food items with regional variation
         spawned_count = 0
-        max_attempts = num_food * 3  # Prevent infinite loops
-        attempts = 0
+        max_attempts = num_food * 3  # Cap on candidate positions tried
         
-        while spawned_count < num_food and attempts < max_attempts:
-            attempts += 1
-            x = random.randint(0, self.width - 1)
-            y = random.randint(0, self.height - 1)
-            
-            # Avoid spawning on existing cells
-            if any(c.x == x and c.y == y for c in self.cells):
-                continue
+        # Candidate positions: every tile without a living creature or an existing item,
+        # drawn without replacement so no position is tried twice
+        occupied = {(c.x, c.y) for c in self.cells if c.alive}
+        occupied.update(self._food_by_pos)
+        free_positions = [
+            (x, y)
+            for x in range(self.width)
+            for y in range(self.height)
+            if (x, y) not in occupied
+        ]
+        candidates = random.sample(free_positions, min(max_attempts, len(free_positions)))
+        food_type_props = self._food_type_props
+        
+        for x, y in candidates:
+            if spawned_count >= num_food:
+                break
             
             # Get biome for this position
             biome = self.environment.get_biome(x, y)
@@ -214,11 +459,11 @@ class World:
             food_type = random.choice(allowed_food_types)
             
             # Get base energy from config and apply ±10% variation
-            base_energy = self.food_type_config[food_type]['base_energy']
+            base_energy, is_positive, _ = food_type_props[food_type]
             energy_value = base_energy * random.uniform(0.9, 1.1)
             
             # Make energy negative if this type removes energy
-            if not self.food_type_config[food_type]['is_positive']:
+            if not is_positive:
                 energy_value = -energy_value
             
             # Round to integer for cleaner values
@@ -232,7 +477,7 @@ class World:
                 'energy_value': energy_value,
                 'region_density': region_density  # Store for reference
             }
-            self.food.append(food_item)
+            self.add_food(food_item)
             # Add to spatial index
             self.spatial_index.add_object(self._resource_id_counter, x, y, 'food')
             self._resource_id_counter += 1
@@ -242,30 +487,32 @@ class World:
         self._debug_log_food_poison()
 
     def _debug_log_food_poison(self):
-        """Print debug logs showing food items with their type properties."""
-        print(f"[DEBUG] Food Summary (Total items: {len(self.food)})")
+        """Log food items with their type properties (only when DEBUG logging is enabled)."""
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        lines = [f"Food Summary (Total items: {len(self.food)})"]
         
         # Group food by type for better readability
-        food_by_type = {}
+        food_by_type = defaultdict(list)
         for food in self.food:
-            food_type = food.get('type', 'unknown')
-            if food_type not in food_by_type:
-                food_by_type[food_type] = []
-            food_by_type[food_type].append(food)
+            food_by_type[food.get('type', 'unknown')].append(food)
         
         for food_type, items in food_by_type.items():
             config = self.food_type_config.get(food_type, {})
             effect = "adds" if config.get('is_positive', True) else "removes"
             lethal = " (LETHAL)" if config.get('is_lethal', False) else ""
-            print(f"[DEBUG] {food_type} ({len(items)} items) - {effect} energy{lethal}:")
+            lines.append(f"{food_type} ({len(items)} items) - {effect} energy{lethal}:")
             for food in items[:5]:  # Show first 5 items of each type
                 energy = food.get('energy_value', 0)
                 sign = "+" if energy > 0 else ""
-                print(f"[DEBUG]   - {food_type} @ ({food['x']}, {food['y']}) ID:{food['id']} energy:{sign}{energy}")
+                lines.append(f"  - {food_type} @ ({food['x']}, {food['y']}) ID:{food['id']} energy:{sign}{energy}")
             if len(items) > 5:
-                print(f"[DEBUG]   ... and {len(items) - 5} more {food_type} items")
+                lines.append(f"  ... and {len(items) - 5} more {food_type} items")
+        
+        # One log record for the whole summary instead of one per line
+        logger.debug("\n".join(lines))
 
-    def get_nearby(self, creature, radius=None):
+    def get_nearby(self, creature, radius=None, top_k=None):
         """
         Return nearby objects for a creature.
         Uses spatial index for efficient queries.
@@ -273,33 +520,29 @@ class World:
         Args:
             creature: Creature object to check around (Cell, Multicellular, or Organism)
             radius: Search radius (default: 3 for Stage 1-2, larger for Stage 3)
+            top_k: Optional cap on the number of food/enemy entries returned
+                   (nearest first). None returns everything in range.
             
         Returns:
             Dict with food, enemy lists, each containing dicts with x, y, dist, id, type
         """
         # Use detection radius for Stage 3 organisms
         if radius is None:
-            if hasattr(creature, 'get_detection_radius'):
-                radius = creature.get_detection_radius()
-            else:
-                radius = 3
+            radius = creature.get_detection_radius()
         nearby = {
             'food': [],
             'enemy': []
         }
 
         # Get creature position (centroid for multicellular)
-        if hasattr(creature, 'get_position'):
-            pos_x, pos_y = creature.get_position()
-        else:
-            pos_x, pos_y = creature.x, creature.y
+        pos_x, pos_y = creature.get_position()
 
         # Use spatial index for efficient queries
         # Get nearby food from spatial index
         nearby_food_objs = self.spatial_index.get_nearby(pos_x, pos_y, radius, obj_type='food')
         for food_obj in nearby_food_objs:
             # Find the actual food item to get full details
-            food_item = next((f for f in self.food if f['id'] == food_obj['id']), None)
+            food_item = self._food_by_id.get(food_obj['id'])
             if food_item:
                 nearby['food'].append({
                     'x': food_item['x'],
@@ -308,23 +551,22 @@ class World:
                     'type': food_item.get('type', 'apple'),  # Include type for frontend
                     'dist': food_obj['dist']
                 })
-        nearby['food'].sort(key=lambda f: f['dist'])
+        if top_k is None:
+            nearby['food'].sort(key=_by_dist)
+        else:
+            nearby['food'] = heapq.nsmallest(top_k, nearby['food'], key=_by_dist)
 
         # Get nearby creatures from spatial index
         nearby_creature_objs = self.spatial_index.get_nearby(pos_x, pos_y, radius, obj_type='creature')
         for creature_obj in nearby_creature_objs:
             # Find the actual creature to get full details
-            other_creature = next((c for c in self.cells if c.id == creature_obj['id']), None)
+            other_creature = self.cells_by_id.get(creature_obj['id'])
             if other_creature and other_creature.id != creature.id and other_creature.alive:
                 # Skip if same colony (multicellular)
-                if hasattr(creature, 'colony') and hasattr(other_creature, 'colony'):
-                    if creature.colony and other_creature.colony and creature.colony.id == other_creature.colony.id:
-                        continue
+                if creature.colony and other_creature.colony and creature.colony.id == other_creature.colony.id:
+                    continue
                 
-                other_pos_x = other_creature.x
-                other_pos_y = other_creature.y
-                if hasattr(other_creature, 'get_position'):
-                    other_pos_x, other_pos_y = other_creature.get_position()
+                other_pos_x, other_pos_y = other_creature.get_position()
                 
                 nearby['enemy'].append({
                     'x': other_pos_x,
@@ -334,7 +576,10 @@ class World:
                     'energy': other_creature.energy,
                     'stage': other_creature.stage
                 })
-        nearby['enemy'].sort(key=lambda e: e['dist'])
+        if top_k is None:
+            nearby['enemy'].sort(key=_by_dist)
+        else:
+            nearby['enemy'] = heapq.nsmallest(top_k, nearby['enemy'], key=_by_dist)
 
         return nearby
 
@@ -354,13 +599,15 @@ class World:
             - string_events: List of event strings for display
             - detailed_events: List of dicts with detailed event info
         """
-        events = []
-        detailed_events = []
-        
         # Merge predator actions into main actions dict
-        if hasattr(self, '_predator_actions'):
+        if self._predator_actions:
             actions.update(self._predator_actions)
-            delattr(self, '_predator_actions')
+            self._predator_actions = {}
+
+        # Occupancy map and grid bounds are built once and shared by the action handlers
+        ctx = _TurnContext(self._build_occupancy(), self.width - 1, self.height - 1)
+        events = ctx.events
+        detailed_events = ctx.detailed_events
 
         # Process actions
         for creature in self.cells:
@@ -369,619 +616,25 @@ class World:
 
             action = actions.get(creature.id)
             if not action:
-                print(f"[DEBUG] Turn {self.turn}: Creature {creature.id} has no action")
+                logger.debug("Turn %s: Creature %s has no action", self.turn, creature.id)
                 continue
 
             action_type = action.get('action')
-            print(f"[DEBUG] Turn {self.turn}: Executing action for Creature {creature.id} (Player {creature.player_id}): {action_type} - {action}")
+            logger.debug("Turn %s: Executing action for Creature %s (Player %s): %s - %s", self.turn, creature.id, creature.player_id, action_type, action)
             
             # Get position (centroid for multicellular)
-            if hasattr(creature, 'get_position'):
-                pos_x, pos_y = creature.get_position()
-            else:
-                pos_x, pos_y = creature.x, creature.y
-
-            if action_type == 'move':
-                dx, dy = action.get('direction', (0, 0))
-                # Speed affects movement distance (faster creatures can move further)
-                # Speed 1-2: normal movement, Speed 3-4: can move 1.5x, Speed 5: can move 2x
-                speed_multiplier = 1.0 + (creature.speed - 3) * 0.25
-                speed_multiplier = max(0.75, min(2.0, speed_multiplier))  # Clamp between 0.75 and 2.0
-                
-                # For simplicity, faster creatures just move more efficiently (lower cost)
-                # The actual movement distance stays 1 cell, but cost is reduced
-                new_x = max(0, min(self.width - 1, pos_x + dx))
-                new_y = max(0, min(self.height - 1, pos_y + dy))
-
-                # Check collision with other creatures
-                collision = any(
-                    c.alive and c.id != creature.id and 
-                    (c.x == new_x and c.y == new_y or 
-                     (hasattr(c, 'get_position') and c.get_position() == (new_x, new_y)))
-                    for c in self.cells
-                )
-
-                if not collision:
-                    old_x, old_y = creature.x, creature.y
-                    creature.x = new_x
-                    creature.y = new_y
-                    # Movement cost scales with stage and speed
-                    # Base cost: 1, reduced by stage and speed
-                    base_cost = 1.0
-                    stage_reduction = (creature.stage - 1) * 0.1
-                    speed_reduction = (creature.speed - 3) * 0.15  # Faster = less cost
-                    move_cost = max(0.3, base_cost - stage_reduction - speed_reduction)
-                    move_cost = int(move_cost) if move_cost >= 1.0 else (1 if move_cost >= 0.5 else 0)
-                    creature.energy -= move_cost
-                    # Track energy event: move action, no object, -move_cost energy
-                    self.energy_events.add(('move', None, -move_cost))
-                    stage_name = "Cell" if creature.stage == 1 else ("Multicellular" if creature.stage == 2 else "Organism")
-                    events.append(f"{stage_name} {creature.name} moved to ({new_x}, {new_y})")
-                    print(f"[DEBUG] Turn {self.turn}: {creature.name} moved from ({old_x}, {old_y}) to ({new_x}, {new_y})")
-                    detailed_events.append({
-                        'creature_id': creature.id,
-                        'type': 'move',
-                        'location': (new_x, new_y)
-                    })
-                else:
-                    print(f"[DEBUG] Turn {self.turn}: {creature.name} movement blocked by collision at ({new_x}, {new_y})")
-                
-                # Check if creature moved away from shelter - auto-unhide
-                if creature.shelter_id is not None:
-                    # Check if still at shelter location
-                    shelter_item = next((f for f in self.food if f['id'] == creature.shelter_id and f.get('type') == 'shelter'), None)
-                    if shelter_item:
-                        # Check if still at shelter position (within 1 cell)
-                        if abs(creature.x - shelter_item['x']) > 1 or abs(creature.y - shelter_item['y']) > 1:
-                            # Moved away from shelter
-                            creature.shelter_id = None
-                            stage_name = "Cell" if creature.stage == 1 else ("Multicellular" if creature.stage == 2 else "Organism")
-                            events.append(f"{stage_name} {creature.name} left shelter")
-                    else:
-                        # Shelter no longer exists
-                        creature.shelter_id = None
-
-            elif action_type == 'hide':
-                target_id = action.get('target_id')
-                # Find shelter item by ID or by position
-                if target_id:
-                    shelter_item = next((f for f in self.food if f['id'] == target_id and f.get('type') == 'shelter'), None)
-                else:
-                    # If no target_id, try to find shelter at current position or adjacent
-                    shelter_item = next(
-                        (f for f in self.food if f.get('type') == 'shelter' and abs(f['x'] - pos_x) <= 1 and abs(f['y'] - pos_y) <= 1),
-                        None
-                    )
-                
-                if shelter_item:
-                    # Check if creature is at shelter location (within 1 cell)
-                    if abs(creature.x - shelter_item['x']) <= 1 and abs(creature.y - shelter_item['y']) <= 1:
-                        creature.shelter_id = shelter_item['id']
-                        stage_name = "Cell" if creature.stage == 1 else ("Multicellular" if creature.stage == 2 else "Organism")
-                        events.append(f"{stage_name} {creature.name} hid in shelter at ({shelter_item['x']}, {shelter_item['y']})")
-                        detailed_events.append({
-                            'creature_id': creature.id,
-                            'type': 'hide',
-                            'location': (shelter_item['x'], shelter_item['y']),
-                            'target_id': shelter_item['id']
-                        })
-                    else:
-                        stage_name = "Cell" if creature.stage == 1 else ("Multicellular" if creature.stage == 2 else "Organism")
-                        events.append(f"{stage_name} {creature.name} tried to hide but not at shelter location")
-                else:
-                    stage_name = "Cell" if creature.stage == 1 else ("Multicellular" if creature.stage == 2 else "Organism")
-                    events.append(f"{stage_name} {creature.name} tried to hide but no shelter found")
-
-            elif action_type == 'drink':
-                target_id = action.get('target_id')
-                # Find water item by ID or by position
-                if target_id:
-                    water_item = next((f for f in self.food if f['id'] == target_id and f.get('type') == 'water'), None)
-                else:
-                    # If no target_id, try to drink water at current position or adjacent
-                    water_item = next(
-                        (f for f in self.food if f.get('type') == 'water' and abs(f['x'] - pos_x) <= 1 and abs(f['y'] - pos_y) <= 1),
-                        None
-                    )
-                
-                if water_item:
-                    energy_value = water_item.get('energy_value', 20)  # Default 20 for water
-                    
-                    # Check resource competition - can creature access this resource?
-                    if not self.resource_manager.can_access_resource(creature.id, water_item['id']):
-                        print(f"[DEBUG] Turn {self.turn}: {creature.name} cannot access water resource {water_item['id']} - claimed by another")
-                        stage_name = "Cell" if creature.stage == 1 else ("Multicellular" if creature.stage == 2 else "Organism")
-                        events.append(f"{stage_name} {creature.name} tried to drink water but it's claimed by another creature")
-                        continue
-                    
-                    # Claim resource if not already claimed
-                    self.resource_manager.claim_resource(creature.id, water_item['id'])
-                    
-                    # Remove from spatial index before removing from food list
-                    self.spatial_index.remove_object(water_item['id'], water_item['x'], water_item['y'])
-                    self.food.remove(water_item)
-                    
-                    # Mark resource as consumed for regeneration tracking
-                    self.resource_manager.mark_resource_consumed(water_item['id'], water_item['x'], water_item['y'])
-                    
-                    # Apply energy gain
-                    creature.energy = min(100, creature.energy + energy_value)
-                    self.energy_events.add(('drink', 'water', energy_value))
-                    
-                    stage_name = "Cell" if creature.stage == 1 else ("Multicellular" if creature.stage == 2 else "Organism")
-                    events.append(f"{stage_name} {creature.name} drank water at ({water_item['x']}, {water_item['y']}) - gained {energy_value} energy")
-                    
-                    detailed_events.append({
-                        'creature_id': creature.id,
-                        'type': 'drink',
-                        'location': (water_item['x'], water_item['y']),
-                        'target_id': water_item['id'],
-                        'food_type': 'water'
-                    })
-                else:
-                    stage_name = "Cell" if creature.stage == 1 else ("Multicellular" if creature.stage == 2 else "Organism")
-                    events.append(f"{stage_name} {creature.name} tried to drink but no water found")
-
-            elif action_type == 'eat':
-                target_id = action.get('target_id')
-                # Find food item by ID or by position
-                if target_id:
-                    food_item = next((f for f in self.food if f['id'] == target_id), None)
-                else:
-                    # If no target_id, try to eat food at current position or adjacent
-                    food_item = next(
-                        (f for f in self.food if abs(f['x'] - pos_x) <= 1 and abs(f['y'] - pos_y) <= 1),
-                        None
-                    )
-                if food_item:
-                    food_type = food_item.get('type', 'apple')
-                    
-                    # Prevent eating water - should use drink action instead
-                    if food_type == 'water':
-                        stage_name = "Cell" if creature.stage == 1 else ("Multicellular" if creature.stage == 2 else "Organism")
-                        events.append(f"{stage_name} {creature.name} tried to eat water - use DRINK action instead")
-                        continue
-                    
-                    # Prevent eating shelter - should use hide action instead
-                    if food_type == 'shelter':
-                        stage_name = "Cell" if creature.stage == 1 else ("Multicellular" if creature.stage == 2 else "Organism")
-                        events.append(f"{stage_name} {creature.name} tried to eat shelter - use HIDE action instead")
-                        continue
-                    
-                    energy_value = food_item.get('energy_value', 0)
-                    
-                    # Get food type properties from config
-                    food_config = self.food_type_config.get(food_type, {})
-                    is_lethal = food_config.get('is_lethal', False)
-                    
-                    # Check resource competition - can creature access this resource?
-                    if not self.resource_manager.can_access_resource(creature.id, food_item['id']):
-                        print(f"[DEBUG] Turn {self.turn}: {creature.name} cannot access resource {food_item['id']} - claimed by another")
-                        stage_name = "Cell" if creature.stage == 1 else ("Multicellular" if creature.stage == 2 else "Organism")
-                        events.append(f"{stage_name} {creature.name} tried to eat {food_type} but it's claimed by another creature")
-                        continue
-                    
-                    # Claim resource if not already claimed
-                    self.resource_manager.claim_resource(creature.id, food_item['id'])
-                    
-                    # Remove from spatial index before removing from food list
-                    self.spatial_index.remove_object(food_item['id'], food_item['x'], food_item['y'])
-                    self.food.remove(food_item)
-                    
-                    # Mark resource as consumed for regeneration tracking
-                    self.resource_manager.mark_resource_consumed(food_item['id'], food_item['x'], food_item['y'])
-                    
-                    stage_name = "Cell" if creature.stage == 1 else ("Multicellular" if creature.stage == 2 else "Organism")
-                    
-                    # Check if this food type is lethal
-                    if is_lethal:
-                        # Lethal food - kill immediately
-                        creature.energy = 0
-                        creature.alive = False
-                        self.energy_events.add(('eat', food_type, energy_value))
-                        events.append(f"{stage_name} {creature.name} ate lethal {food_type} at ({food_item['x']}, {food_item['y']}) - DIED!")
-                    else:
-                        # Regular food - apply energy change
-                        # Apply stage 3 bonus if applicable (only for positive energy)
-                        if energy_value > 0 and creature.stage == 3 and hasattr(creature, 'parts') and creature.parts.get('mouth') == 'sharp':
-                            energy_value = int(energy_value * 1.33)  # 33% bonus
-                        
-                        if energy_value > 0:
-                            creature.energy = min(100, creature.energy + energy_value)
-                            self.energy_events.add(('eat', food_type, energy_value))
-                            events.append(f"{stage_name} {creature.name} ate {food_type} at ({food_item['x']}, {food_item['y']}) - gained {energy_value} energy")
-                        else:
-                            creature.energy = max(0, creature.energy + energy_value)
-                            self.energy_events.add(('eat', food_type, energy_value))
-                            events.append(f"{stage_name} {creature.name} ate {food_type} at ({food_item['x']}, {food_item['y']}) - lost {abs(energy_value)} energy!")
-                    
-                    detailed_events.append({
-                        'creature_id': creature.id,
-                        'type': 'eat',
-                        'location': (food_item['x'], food_item['y']),
-                        'target_id': food_item['id'],
-                        'food_type': food_type
-                    })
-
-            elif action_type == 'flee':
-                dx, dy = action.get('direction', (0, 0))
-                new_x = max(0, min(self.width - 1, pos_x + dx))
-                new_y = max(0, min(self.height - 1, pos_y + dy))
-                creature.x = new_x
-                creature.y = new_y
-                
-                # Check if creature moved away from shelter - auto-unhide
-                if creature.shelter_id is not None:
-                    shelter_item = next((f for f in self.food if f['id'] == creature.shelter_id and f.get('type') == 'shelter'), None)
-                    if shelter_item:
-                        if abs(creature.x - shelter_item['x']) > 1 or abs(creature.y - shelter_item['y']) > 1:
-                            creature.shelter_id = None
-                            stage_name = "Cell" if creature.stage == 1 else ("Multicellular" if creature.stage == 2 else "Organism")
-                            events.append(f"{stage_name} {creature.name} left shelter")
-                    else:
-                        creature.shelter_id = None
-                # Fleeing costs more, but scales with speed (faster creatures flee more efficiently)
-                flee_cost = max(1, 3 - creature.speed // 2)
-                creature.energy -= flee_cost
-                # Track energy event: flee action, no object, -flee_cost energy
-                self.energy_events.add(('flee', None, -flee_cost))
-                stage_name = "Cell" if creature.stage == 1 else ("Multicellular" if creature.stage == 2 else "Organism")
-                events.append(f"{stage_name} {creature.name} fled to ({new_x}, {new_y})")
-                detailed_events.append({
-                    'creature_id': creature.id,
-                    'type': 'flee',
-                    'location': (new_x, new_y)
-                })
-
-            elif action_type == 'attack':
-                from .combat import Combat
-                target_id = action.get('target_id')
-                
-                # Find target creature
-                target_creature = None
-                if target_id:
-                    target_creature = next((c for c in self.cells if c.id == target_id and c.alive), None)
-                else:
-                    # If no target_id, find nearest enemy within attack range
-                    for other in self.cells:
-                        if other.id != creature.id and other.alive and other.player_id != creature.player_id:
-                            other_pos_x, other_pos_y = other.x, other.y
-                            if hasattr(other, 'get_position'):
-                                other_pos_x, other_pos_y = other.get_position()
-                            distance = math.sqrt((other_pos_x - pos_x)**2 + (other_pos_y - pos_y)**2)
-                            if distance <= 1.5:
-                                target_creature = other
-                                break
-                
-                if target_creature and Combat.can_attack(creature, target_creature):
-                    # Check if target is hidden in shelter - if so, block attack
-                    if target_creature.shelter_id is not None:
-                        stage_name = "Cell" if creature.stage == 1 else ("Multicellular" if creature.stage == 2 else "Organism")
-                        target_stage_name = "Cell" if target_creature.stage == 1 else ("Multicellular" if target_creature.stage == 2 else "Organism")
-                        events.append(f"{stage_name} {creature.name} tried to attack {target_stage_name} {target_creature.name} but it's hidden in shelter!")
-                        continue
-                    
-                    # Resolve combat
-                    damage, defender_killed, energy_gained = Combat.resolve_combat(creature, target_creature)
-                    
-                    stage_name = "Cell" if creature.stage == 1 else ("Multicellular" if creature.stage == 2 else "Organism")
-                    target_stage_name = "Cell" if target_creature.stage == 1 else ("Multicellular" if target_creature.stage == 2 else "Organism")
-                    
-                    if defender_killed:
-                        events.append(f"{stage_name} {creature.name} attacked and killed {target_stage_name} {target_creature.name} (damage: {damage})")
-                        if energy_gained > 0:
-                            events.append(f"{stage_name} {creature.name} gained {energy_gained} energy from predation")
-                            self.energy_events.add(('attack', f"creature_{target_creature.id}", energy_gained))
-                        detailed_events.append({
-                            'creature_id': creature.id,
-                            'type': 'attack',
-                            'target_id': target_creature.id,
-                            'damage': damage,
-                            'killed': True,
-                            'energy_gained': energy_gained
-                        })
-                    else:
-                        events.append(f"{stage_name} {creature.name} attacked {target_stage_name} {target_creature.name} for {damage} damage")
-                        detailed_events.append({
-                            'creature_id': creature.id,
-                            'type': 'attack',
-                            'target_id': target_creature.id,
-                            'damage': damage,
-                            'killed': False
-                        })
-                    
-                    # Track energy event for attack cost
-                    self.energy_events.add(('attack', None, -3))
-                else:
-                    print(f"[DEBUG] Turn {self.turn}: {creature.name} attack failed - no valid target")
-                    stage_name = "Cell" if creature.stage == 1 else ("Multicellular" if creature.stage == 2 else "Organism")
-                    events.append(f"{stage_name} {creature.name} tried to attack but no valid target")
-
-            elif action_type == 'reproduce':
-                # Check if creature has enough energy
-                if creature.energy < 88:
-                    print(f"[DEBUG] Turn {self.turn}: {creature.name} reproduction failed - insufficient energy ({creature.energy} < 88)")
-                    stage_name = "Cell" if creature.stage == 1 else ("Multicellular" if creature.stage == 2 else "Organism")
-                    events.append(f"{stage_name} {creature.name} tried to reproduce but lacks energy ({creature.energy}/88)")
-                    continue
-                
-                # Check if another creature is at the same position (meeting)
-                other_creature = None
-                for other in self.cells:
-                    if (other.id != creature.id and other.alive and 
-                        other.x == pos_x and other.y == pos_y):
-                        other_creature = other
-                        break
-                
-                # If no other creature at same position, check adjacent positions
-                if other_creature is None:
-                    for other in self.cells:
-                        if (other.id != creature.id and other.alive):
-                            other_pos_x, other_pos_y = other.x, other.y
-                            if hasattr(other, 'get_position'):
-                                other_pos_x, other_pos_y = other.get_position()
-                            # Check if adjacent (within 1 cell)
-                            if abs(other_pos_x - pos_x) <= 1 and abs(other_pos_y - pos_y) <= 1:
-                                other_creature = other
-                                break
-                
-                # Need another creature to reproduce
-                if other_creature is None:
-                    print(f"[DEBUG] Turn {self.turn}: {creature.name} reproduction failed - no partner nearby")
-                    stage_name = "Cell" if creature.stage == 1 else ("Multicellular" if creature.stage == 2 else "Organism")
-                    events.append(f"{stage_name} {creature.name} tried to reproduce but no partner nearby")
-                    continue
-                
-                # Both creatures must have energy >= 88
-                if other_creature.energy < 88:
-                    print(f"[DEBUG] Turn {self.turn}: {creature.name} reproduction failed - partner {other_creature.name} has insufficient energy ({other_creature.energy} < 88)")
-                    stage_name = "Cell" if creature.stage == 1 else ("Multicellular" if creature.stage == 2 else "Organism")
-                    events.append(f"{stage_name} {creature.name} tried to reproduce but partner {other_creature.name} lacks energy ({other_creature.energy}/88)")
-                    continue
-                
-                # Compatibility check: 70% base chance, modified by traits
-                base_compatibility = 0.7
-                # Modify compatibility based on color similarity (same color = higher compatibility)
-                color_bonus = 0.1 if creature.color == other_creature.color else 0.0
-                # Modify compatibility based on diet similarity
-                diet_bonus = 0.1 if creature.diet == other_creature.diet else 0.0
-                compatibility = min(1.0, base_compatibility + color_bonus + diet_bonus)
-                
-                # Random check for compatibility
-                compatibility_roll = random.random()
-                if compatibility_roll > compatibility:
-                    # Creatures don't like each other, no reproduction
-                    print(f"[DEBUG] Turn {self.turn}: {creature.name} reproduction failed - compatibility check failed ({compatibility_roll:.2f} > {compatibility:.2f})")
-                    stage_name = "Cell" if creature.stage == 1 else ("Multicellular" if creature.stage == 2 else "Organism")
-                    events.append(f"{stage_name} {creature.name} and {other_creature.name} tried to reproduce but were incompatible")
-                    continue
-                
-                # Both creatures meet requirements - one reproduces
-                # Create new creature of same type nearby
-                directions = [(0, -1), (0, 1), (-1, 0), (1, 0)]
-                random.shuffle(directions)
-                reproduction_success = False
-                for dx, dy in directions:
-                    new_x = max(0, min(self.width - 1, pos_x + dx))
-                    new_y = max(0, min(self.height - 1, pos_y + dy))
-                    # Check if position is free
-                    if not any(c.alive and c.x == new_x and c.y == new_y for c in self.cells):
-                        # Create new creature with same traits and stage as parent
-                        # Apply genetic variation if specified
-                        offspring_traits = creature.traits.copy()
-                        genetic_variation = offspring_traits.get('genetic_variation', {})
-                        
-                        if genetic_variation:
-                            # Apply speed variation
-                            if 'speed' in genetic_variation:
-                                speed_modifier = genetic_variation['speed']
-                                base_speed = offspring_traits.get('speed', 3)
-                                new_speed = int(base_speed * (1.0 + speed_modifier))
-                                new_speed = max(1, min(5, new_speed))  # Clamp to 1-5
-                                offspring_traits['speed'] = new_speed
-                            
-                            # Apply color variation
-                            if 'color' in genetic_variation and genetic_variation['color'] == 'varied':
-                                import random
-                                colors = ['blue', 'red', 'green', 'yellow', 'purple', 'orange', 'pink', 'cyan', 'brown', 'black', 'white']
-                                offspring_traits['color'] = random.choice(colors)
-                            
-                            # Apply strength variation (affects starting energy)
-                            strength_modifier = genetic_variation.get('strength', 0.0)
-                        
-                        # Generate offspring name based on parent names
-                        offspring_name = f"{creature.name}'s Offspring"
-                        if creature.stage == 1:
-                            from .cell import Cell
-                            new_creature = Cell(
-                                creature_id=self._resource_id_counter,
-                                traits=offspring_traits,
-                                x=new_x,
-                                y=new_y,
-                                player_id=creature.player_id,
-                                name=offspring_name
-                            )
-                        elif creature.stage == 2:
-                            from .multicellular import Multicellular
-                            new_creature = Multicellular(
-                                creature_id=self._resource_id_counter,
-                                traits=offspring_traits,
-                                x=new_x,
-                                y=new_y,
-                                player_id=creature.player_id,
-                                name=offspring_name
-                            )
-                        else:  # stage 3
-                            from .organism import Organism
-                            new_creature = Organism(
-                                creature_id=self._resource_id_counter,
-                                traits=offspring_traits,
-                                x=new_x,
-                                y=new_y,
-                                player_id=creature.player_id,
-                                name=offspring_name
-                            )
-                        
-                        # Apply starting energy with strength modifier
-                        base_energy = 50
-                        if genetic_variation and 'strength' in genetic_variation:
-                            base_energy = int(base_energy * (1.0 + genetic_variation['strength']))
-                        new_creature.energy = base_energy
-                        # Reproduction cost scales with stage (higher stage = more efficient)
-                        reproduce_cost = max(40, 50 - (creature.stage - 1) * 5)
-                        # Both creatures lose energy
-                        creature.energy -= reproduce_cost
-                        other_creature.energy -= reproduce_cost
-                        # Track energy event: reproduce action, no object, -reproduce_cost energy
-                        self.energy_events.add(('reproduce', None, -reproduce_cost))
-                        self.add_cell(new_creature)
-                        self._resource_id_counter += 1
-                        stage_name = "Cell" if creature.stage == 1 else ("Multicellular" if creature.stage == 2 else "Organism")
-                        events.append(f"{stage_name} {creature.name} and {other_creature.name} reproduced at ({new_x}, {new_y})")
-                        detailed_events.append({
-                            'creature_id': creature.id,
-                            'type': 'reproduce',
-                            'location': (new_x, new_y),
-                            'offspring_id': new_creature.id,
-                            'partner_id': other_creature.id
-                        })
-                        reproduction_success = True
-                        print(f"[DEBUG] Turn {self.turn}: {creature.name} successfully reproduced with {other_creature.name}, created offspring {new_creature.name}")
-                        break
-                
-                # If no free space found for offspring
-                if not reproduction_success:
-                    print(f"[DEBUG] Turn {self.turn}: {creature.name} reproduction failed - no free space for offspring")
-                    stage_name = "Cell" if creature.stage == 1 else ("Multicellular" if creature.stage == 2 else "Organism")
-                    events.append(f"{stage_name} {creature.name} and {other_creature.name} tried to reproduce but no space available")
-
-            elif action_type == 'signal':
-                # Signal action - communicate with nearby creatures of same player
-                nearby_allies = [c for c in self.cells 
-                               if c.id != creature.id and c.alive and c.player_id == creature.player_id
-                               and abs(c.x - pos_x) <= 3 and abs(c.y - pos_y) <= 3]
-                
-                if nearby_allies:
-                    # Use social system to record communication
-                    ally_ids = [c.id for c in nearby_allies]
-                    self.social_system.communicate(creature.id, 'signal', ally_ids)
-                    
-                    stage_name = "Cell" if creature.stage == 1 else ("Multicellular" if creature.stage == 2 else "Organism")
-                    events.append(f"{stage_name} {creature.name} signaled {len(nearby_allies)} nearby allies")
-                    detailed_events.append({
-                        'creature_id': creature.id,
-                        'type': 'signal',
-                        'allies_count': len(nearby_allies)
-                    })
-                else:
-                    print(f"[DEBUG] Turn {self.turn}: {creature.name} signaled but no allies nearby")
-
-            elif action_type == 'claim':
-                # Claim territory action - claim current area
-                region_x = pos_x // self.region_size
-                region_y = pos_y // self.region_size
-                region_key = (region_x, region_y)
-                
-                # Use territory manager
-                if self.territory_manager.claim_territory(region_key, creature.id):
-                    stage_name = "Cell" if creature.stage == 1 else ("Multicellular" if creature.stage == 2 else "Organism")
-                    events.append(f"{stage_name} {creature.name} claimed territory at region ({region_x}, {region_y})")
-                    detailed_events.append({
-                        'creature_id': creature.id,
-                        'type': 'claim',
-                        'region': region_key
-                    })
-                else:
-                    stage_name = "Cell" if creature.stage == 1 else ("Multicellular" if creature.stage == 2 else "Organism")
-                    events.append(f"{stage_name} {creature.name} tried to claim territory but it's already claimed")
-
-            elif action_type == 'cooperate':
-                # Cooperate action - share resources or work together
-                target_id = action.get('target_id')
-                target_creature = None
-                
-                if target_id:
-                    target_creature = next((c for c in self.cells if c.id == target_id and c.alive), None)
-                else:
-                    # Find nearest ally
-                    for other in self.cells:
-                        if other.id != creature.id and other.alive and other.player_id == creature.player_id:
-                            other_pos_x, other_pos_y = other.x, other.y
-                            if hasattr(other, 'get_position'):
-                                other_pos_x, other_pos_y = other.get_position()
-                            distance = math.sqrt((other_pos_x - pos_x)**2 + (other_pos_y - pos_y)**2)
-                            if distance <= 2:
-                                target_creature = other
-                                break
-                
-                if target_creature:
-                    # Share energy (creature gives some energy to target)
-                    share_amount = min(10, creature.energy // 4)
-                    if share_amount > 0:
-                        creature.energy -= share_amount
-                        target_creature.energy = min(100, target_creature.energy + share_amount)
-                        stage_name = "Cell" if creature.stage == 1 else ("Multicellular" if creature.stage == 2 else "Organism")
-                        events.append(f"{stage_name} {creature.name} cooperated with {target_creature.name}, shared {share_amount} energy")
-                        detailed_events.append({
-                            'creature_id': creature.id,
-                            'type': 'cooperate',
-                            'target_id': target_creature.id,
-                            'energy_shared': share_amount
-                        })
-                        self.energy_events.add(('cooperate', f"creature_{target_creature.id}", -share_amount))
-                else:
-                    print(f"[DEBUG] Turn {self.turn}: {creature.name} tried to cooperate but no valid target")
+            pos_x, pos_y = creature.get_position()
+            # Display name for this creature's events (stage does not change mid-turn)
+            stage_name = _STAGE_NAMES[creature.stage]
 
-            elif action_type == 'migrate':
-                # Migrate action - move toward resource-rich area
-                rich_areas = self.resource_manager.get_resource_rich_areas(creature)
-                
-                if rich_areas:
-                    # Move toward richest area
-                    target_x, target_y, _ = rich_areas[0]
-                    dx = 1 if target_x > pos_x else (-1 if target_x < pos_x else 0)
-                    dy = 1 if target_y > pos_y else (-1 if target_y < pos_y else 0)
-                    
-                    new_x = max(0, min(self.width - 1, pos_x + dx))
-                    new_y = max(0, min(self.height - 1, pos_y + dy))
-                    
-                    # Check collision
-                    collision = any(
-                        c.alive and c.id != creature.id and 
-                        (c.x == new_x and c.y == new_y or 
-                         (hasattr(c, 'get_position') and c.get_position() == (new_x, new_y)))
-                        for c in self.cells
-                    )
-                    
-                    if not collision:
-                        creature.x = new_x
-                        creature.y = new_y
-                        # Migration cost scales with speed (faster creatures migrate more efficiently)
-                        migrate_cost = max(0.5, 1.0 - (creature.speed - 3) * 0.2)
-                        migrate_cost = int(migrate_cost) if migrate_cost >= 1.0 else 1
-                        creature.energy -= migrate_cost
-                        self.energy_events.add(('migrate', None, -migrate_cost))
-                        stage_name = "Cell" if creature.stage == 1 else ("Multicellular" if creature.stage == 2 else "Organism")
-                        events.append(f"{stage_name} {creature.name} migrated toward resource-rich area ({new_x}, {new_y})")
-                        detailed_events.append({
-                            'creature_id': creature.id,
-                            'type': 'migrate',
-                            'location': (new_x, new_y)
-                        })
-                else:
-                    # No rich areas found, just move randomly
-                    import random
-                    direction = random.choice([(0, -1), (0, 1), (-1, 0), (1, 0)])
-                    new_x = max(0, min(self.width - 1, pos_x + direction[0]))
-                    new_y = max(0, min(self.height - 1, pos_y + direction[1]))
-                    creature.x = new_x
-                    creature.y = new_y
-                    creature.energy -= 1
+            handler = self._action_handlers.get(action_type)
+            if handler is not None and handler(creature, action, pos_x, pos_y, stage_name, ctx):
+                # The action bailed out early: skip the death check and aging this turn
+                continue
 
             # Check if creature dies (skip if already dead from lethal food)
             if creature.energy <= 0 and creature.alive:
                 creature.alive = False
-                stage_name = "Cell" if creature.stage == 1 else ("Multicellular" if creature.stage == 2 else "Organism")
                 events.append(f"{stage_name} {creature.name} died")
                 detailed_events.append({
                     'creature_id': creature.id,
@@ -1015,6 +668,530 @@ class World:
         self.turn += 1
         return events, detailed_events
     
+    def _do_move(self, creature, action, pos_x, pos_y, stage_name, ctx):
+        """Handle a 'move' action."""
+        dx, dy = action.get('direction', (0, 0))
+        # Speed affects movement distance (faster creatures can move further)
+        # Speed 1-2: normal movement, Speed 3-4: can move 1.5x, Speed 5: can move 2x
+        speed_multiplier = 1.0 + (creature.speed - 3) * 0.25
+        speed_multiplier = max(0.75, min(2.0, speed_multiplier))  # Clamp between 0.75 and 2.0
+        
+        # For simplicity, faster creatures just move more efficiently (lower cost)
+        # The actual movement distance stays 1 cell, but cost is reduced
+        new_x = max(0, min(ctx.max_x, pos_x + dx))
+        new_y = max(0, min(ctx.max_y, pos_y + dy))
+
+        # Check collision with other creatures
+        collision = self._is_occupied(ctx.occupancy, new_x, new_y, exclude=creature)
+
+        if not collision:
+            old_x, old_y = creature.x, creature.y
+            self._relocate(ctx.occupancy, creature, new_x, new_y)
+            # Movement cost scales with stage and speed
+            # Base cost: 1, reduced by stage and speed
+            base_cost = 1.0
+            stage_reduction = (creature.stage - 1) * 0.1
+            speed_reduction = (creature.speed - 3) * 0.15  # Faster = less cost
+            move_cost = max(0.3, base_cost - stage_reduction - speed_reduction)
+            move_cost = int(move_cost) if move_cost >= 1.0 else (1 if move_cost >= 0.5 else 0)
+            creature.energy -= move_cost
+            # Track energy event: move action, no object, -move_cost energy
+            self.energy_events.add(('move', None, -move_cost))
+            ctx.events.append(f"{stage_name} {creature.name} moved to ({new_x}, {new_y})")
+            logger.debug("Turn %s: %s moved from (%s, %s) to (%s, %s)", self.turn, creature.name, old_x, old_y, new_x, new_y)
+            ctx.detailed_events.append({
+                'creature_id': creature.id,
+                'type': 'move',
+                'location': (new_x, new_y)
+            })
+        else:
+            logger.debug("Turn %s: %s movement blocked by collision at (%s, %s)", self.turn, creature.name, new_x, new_y)
+        
+        # Check if creature moved away from shelter - auto-unhide
+        if creature.shelter_id is not None:
+            # Check if still at shelter location
+            shelter_item = self._find_resource(creature.shelter_id, 'shelter')
+            if shelter_item:
+                # Check if still at shelter position (within 1 cell)
+                if abs(creature.x - shelter_item['x']) > 1 or abs(creature.y - shelter_item['y']) > 1:
+                    # Moved away from shelter
+                    creature.shelter_id = None
+                    ctx.events.append(f"{stage_name} {creature.name} left shelter")
+            else:
+                # Shelter no longer exists
+                creature.shelter_id = None
+
+    def _do_hide(self, creature, action, pos_x, pos_y, stage_name, ctx):
+        """Handle a 'hide' action."""
+        target_id = action.get('target_id')
+        # Find shelter item by ID or by position
+        if target_id:
+            shelter_item = self._find_resource(target_id, 'shelter')
+        else:
+            # If no target_id, try to find shelter at current position or adjacent
+            shelter_item = self._find_adjacent_resource(pos_x, pos_y, 'shelter')
+        
+        if shelter_item:
+            # Check if creature is at shelter location (within 1 cell)
+            if abs(creature.x - shelter_item['x']) <= 1 and abs(creature.y - shelter_item['y']) <= 1:
+                creature.shelter_id = shelter_item['id']
+                ctx.events.append(f"{stage_name} {creature.name} hid in shelter at ({shelter_item['x']}, {shelter_item['y']})")
+                ctx.detailed_events.append({
+                    'creature_id': creature.id,
+                    'type': 'hide',
+                    'location': (shelter_item['x'], shelter_item['y']),
+                    'target_id': shelter_item['id']
+                })
+            else:
+                ctx.events.append(f"{stage_name} {creature.name} tried to hide but not at shelter location")
+        else:
+            ctx.events.append(f"{stage_name} {creature.name} tried to hide but no shelter found")
+
+    def _do_drink(self, creature, action, pos_x, pos_y, stage_name, ctx):
+        """Handle a 'drink' action."""
+        target_id = action.get('target_id')
+        # Find water item by ID or by position
+        if target_id:
+            water_item = self._find_resource(target_id, 'water')
+        else:
+            # If no target_id, try to drink water at current position or adjacent
+            water_item = self._find_adjacent_resource(pos_x, pos_y, 'water')
+        
+        if water_item:
+            energy_value = water_item.get('energy_value', 20)  # Default 20 for water
+            
+            # Check resource competition - can creature access this resource?
+            if not self.resource_manager.can_access_resource(creature.id, water_item['id']):
+                logger.debug("Turn %s: %s cannot access water resource %s - claimed by another", self.turn, creature.name, water_item['id'])
+                ctx.events.append(f"{stage_name} {creature.name} tried to drink water but it's claimed by another creature")
+                return True
+            
+            # Claim resource if not already claimed
+            self.resource_manager.claim_resource(creature.id, water_item['id'])
+            
+            # Remove from food list and spatial index
+            self.remove_food(water_item)
+            
+            # Mark resource as consumed for regeneration tracking
+            self.resource_manager.mark_resource_consumed(water_item['id'], water_item['x'], water_item['y'])
+            
+            # Apply energy gain
+            creature.energy = min(100, creature.energy + energy_value)
+            self.energy_events.add(('drink', 'water', energy_value))
+            
+            ctx.events.append(f"{stage_name} {creature.name} drank water at ({water_item['x']}, {water_item['y']}) - gained {energy_value} energy")
+            
+            ctx.detailed_events.append({
+                'creature_id': creature.id,
+                'type': 'drink',
+                'location': (water_item['x'], water_item['y']),
+                'target_id': water_item['id'],
+                'food_type': 'water'
+            })
+        else:
+            ctx.events.append(f"{stage_name} {creature.name} tried to drink but no water found")
+
+    def _do_eat(self, creature, action, pos_x, pos_y, stage_name, ctx):
+        """Handle a 'eat' action."""
+        target_id = action.get('target_id')
+        # Find food item by ID or by position
+        if target_id:
+            food_item = self._find_resource(target_id)
+        else:
+            # If no target_id, try to eat food at current position or adjacent
+            food_item = self._find_adjacent_resource(pos_x, pos_y)
+        if food_item:
+            food_type = food_item.get('type', 'apple')
+            
+            # Prevent eating water - should use drink action instead
+            if food_type == 'water':
+                ctx.events.append(f"{stage_name} {creature.name} tried to eat water - use DRINK action instead")
+                return True
+            
+            # Prevent eating shelter - should use hide action instead
+            if food_type == 'shelter':
+                ctx.events.append(f"{stage_name} {creature.name} tried to eat shelter - use HIDE action instead")
+                return True
+            
+            energy_value = food_item.get('energy_value', 0)
+            
+            # Get food type properties from config
+            type_props = self._food_type_props.get(food_type)
+            is_lethal = type_props[2] if type_props else False
+            
+            # Check resource competition - can creature access this resource?
+            if not self.resource_manager.can_access_resource(creature.id, food_item['id']):
+                logger.debug("Turn %s: %s cannot access resource %s - claimed by another", self.turn, creature.name, food_item['id'])
+                ctx.events.append(f"{stage_name} {creature.name} tried to eat {food_type} but it's claimed by another creature")
+                return True
+            
+            # Claim resource if not already claimed
+            self.resource_manager.claim_resource(creature.id, food_item['id'])
+            
+            # Remove from food list and spatial index
+            self.remove_food(food_item)
+            
+            # Mark resource as consumed for regeneration tracking
+            self.resource_manager.mark_resource_consumed(food_item['id'], food_item['x'], food_item['y'])
+            
+            
+            # Check if this food type is lethal
+            if is_lethal:
+                # Lethal food - kill immediately
+                creature.energy = 0
+                creature.alive = False
+                self.energy_events.add(('eat', food_type, energy_value))
+                ctx.events.append(f"{stage_name} {creature.name} ate lethal {food_type} at ({food_item['x']}, {food_item['y']}) - DIED!")
+            else:
+                # Regular food - apply energy change
+                # Apply stage 3 bonus if applicable (only for positive energy)
+                if energy_value > 0 and creature.stage == 3 and creature.parts.get('mouth') == 'sharp':
+                    energy_value = int(energy_value * 1.33)  # 33% bonus
+                
+                if energy_value > 0:
+                    creature.energy = min(100, creature.energy + energy_value)
+                    self.energy_events.add(('eat', food_type, energy_value))
+                    ctx.events.append(f"{stage_name} {creature.name} ate {food_type} at ({food_item['x']}, {food_item['y']}) - gained {energy_value} energy")
+                else:
+                    creature.energy = max(0, creature.energy + energy_value)
+                    self.energy_events.add(('eat', food_type, energy_value))
+                    ctx.events.append(f"{stage_name} {creature.name} ate {food_type} at ({food_item['x']}, {food_item['y']}) - lost {abs(energy_value)} energy!")
+            
+            ctx.detailed_events.append({
+                'creature_id': creature.id,
+                'type': 'eat',
+                'location': (food_item['x'], food_item['y']),
+                'target_id': food_item['id'],
+                'food_type': food_type
+            })
+
+    def _do_flee(self, creature, action, pos_x, pos_y, stage_name, ctx):
+        """Handle a 'flee' action."""
+        dx, dy = action.get('direction', (0, 0))
+        new_x = max(0, min(ctx.max_x, pos_x + dx))
+        new_y = max(0, min(ctx.max_y, pos_y + dy))
+        self._relocate(ctx.occupancy, creature, new_x, new_y)
+        
+        # Check if creature moved away from shelter - auto-unhide
+        if creature.shelter_id is not None:
+            shelter_item = self._find_resource(creature.shelter_id, 'shelter')
+            if shelter_item:
+                if abs(creature.x - shelter_item['x']) > 1 or abs(creature.y - shelter_item['y']) > 1:
+                    creature.shelter_id = None
+                    ctx.events.append(f"{stage_name} {creature.name} left shelter")
+            else:
+                creature.shelter_id = None
+        # Fleeing costs more, but scales with speed (faster creatures flee more efficiently)
+        flee_cost = max(1, 3 - creature.speed // 2)
+        creature.energy -= flee_cost
+        # Track energy event: flee action, no object, -flee_cost energy
+        self.energy_events.add(('flee', None, -flee_cost))
+        ctx.events.append(f"{stage_name} {creature.name} fled to ({new_x}, {new_y})")
+        ctx.detailed_events.append({
+            'creature_id': creature.id,
+            'type': 'flee',
+            'location': (new_x, new_y)
+        })
+
+    def _do_attack(self, creature, action, pos_x, pos_y, stage_name, ctx):
+        """Handle a 'attack' action."""
+        from .combat import Combat
+        target_id = action.get('target_id')
+        
+        # Find target creature
+        target_creature = None
+        if target_id:
+            target_creature = self.cells_by_id.get(target_id)
+            if target_creature is not None and not target_creature.alive:
+                target_creature = None
+        else:
+            # If no target_id, find nearest enemy within attack range
+            for other in self.cells:
+                if other.id != creature.id and other.alive and other.player_id != creature.player_id:
+                    other_pos_x, other_pos_y = other.get_position()
+                    # Attack range: same or adjacent tile (distance <= 1.5 on the integer grid)
+                    if abs(other_pos_x - pos_x) <= 1 and abs(other_pos_y - pos_y) <= 1:
+                        target_creature = other
+                        break
+        
+        if target_creature and Combat.can_attack(creature, target_creature):
+            # Check if target is hidden in shelter - if so, block attack
+            if target_creature.shelter_id is not None:
+                target_stage_name = _STAGE_NAMES[target_creature.stage]
+                ctx.events.append(f"{stage_name} {creature.name} tried to attack {target_stage_name} {target_creature.name} but it's hidden in shelter!")
+                return True
+            
+            # Resolve combat
+            damage, defender_killed, energy_gained = Combat.resolve_combat(creature, target_creature)
+            
+            target_stage_name = _STAGE_NAMES[target_creature.stage]
+            
+            if defender_killed:
+                ctx.events.append(f"{stage_name} {creature.name} attacked and killed {target_stage_name} {target_creature.name} (damage: {damage})")
+                if energy_gained > 0:
+                    ctx.events.append(f"{stage_name} {creature.name} gained {energy_gained} energy from predation")
+                    self.energy_events.add(('attack', f"creature_{target_creature.id}", energy_gained))
+                ctx.detailed_events.append({
+                    'creature_id': creature.id,
+                    'type': 'attack',
+                    'target_id': target_creature.id,
+                    'damage': damage,
+                    'killed': True,
+                    'energy_gained': energy_gained
+                })
+            else:
+                ctx.events.append(f"{stage_name} {creature.name} attacked {target_stage_name} {target_creature.name} for {damage} damage")
+                ctx.detailed_events.append({
+                    'creature_id': creature.id,
+                    'type': 'attack',
+                    'target_id': target_creature.id,
+                    'damage': damage,
+                    'killed': False
+                })
+            
+            # Track energy event for attack cost
+            self.energy_events.add(('attack', None, -3))
+        else:
+            logger.debug("Turn %s: %s attack failed - no valid target", self.turn, creature.name)
+            ctx.events.append(f"{stage_name} {creature.name} tried to attack but no valid target")
+
+    def _do_reproduce(self, creature, action, pos_x, pos_y, stage_name, ctx):
+        """Handle a 'reproduce' action."""
+        # Check if creature has enough energy
+        if creature.energy < 88:
+            logger.debug("Turn %s: %s reproduction failed - insufficient energy (%s < 88)", self.turn, creature.name, creature.energy)
+            ctx.events.append(f"{stage_name} {creature.name} tried to reproduce but lacks energy ({creature.energy}/88)")
+            return True
+        
+        # Look for a partner at the same position (meeting) first, then in the
+        # 8 adjacent tiles, probing the ctx.occupancy map instead of scanning all cells
+        other_creature = None
+        for dx, dy in _NEIGHBOR_OFFSETS:
+            for other in ctx.occupancy.get((pos_x + dx, pos_y + dy), ()):
+                if other is not creature and other.alive:
+                    other_creature = other
+                    break
+            if other_creature is not None:
+                break
+        
+        # Need another creature to reproduce
+        if other_creature is None:
+            logger.debug("Turn %s: %s reproduction failed - no partner nearby", self.turn, creature.name)
+            ctx.events.append(f"{stage_name} {creature.name} tried to reproduce but no partner nearby")
+            return True
+        
+        # Both creatures must have energy >= 88
+        if other_creature.energy < 88:
+            logger.debug("Turn %s: %s reproduction failed - partner %s has insufficient energy (%s < 88)", self.turn, creature.name, other_creature.name, other_creature.energy)
+            ctx.events.append(f"{stage_name} {creature.name} tried to reproduce but partner {other_creature.name} lacks energy ({other_creature.energy}/88)")
+            return True
+        
+        # Compatibility check: 70% base chance, modified by traits
+        base_compatibility = 0.7
+        # Modify compatibility based on color similarity (same color = higher compatibility)
+        color_bonus = 0.1 if creature.color == other_creature.color else 0.0
+        # Modify compatibility based on diet similarity
+        diet_bonus = 0.1 if creature.diet == other_creature.diet else 0.0
+        compatibility = min(1.0, base_compatibility + color_bonus + diet_bonus)
+        
+        # Random check for compatibility
+        compatibility_roll = random.random()
+        if compatibility_roll > compatibility:
+            # Creatures don't like each other, no reproduction
+            logger.debug("Turn %s: %s reproduction failed - compatibility check failed (%.2f > %.2f)", self.turn, creature.name, compatibility_roll, compatibility)
+            ctx.events.append(f"{stage_name} {creature.name} and {other_creature.name} tried to reproduce but were incompatible")
+            return True
+        
+        # Both creatures meet requirements - one reproduces
+        # Create new creature of same type nearby
+        directions = [(0, -1), (0, 1), (-1, 0), (1, 0)]
+        random.shuffle(directions)
+        reproduction_success = False
+        for dx, dy in directions:
+            new_x = max(0, min(ctx.max_x, pos_x + dx))
+            new_y = max(0, min(ctx.max_y, pos_y + dy))
+            # Check if position is free
+            if not self._is_occupied(ctx.occupancy, new_x, new_y):
+                # Create new creature with same traits and stage as parent
+                # Apply genetic variation if specified
+                offspring_traits = creature.traits.copy()
+                genetic_variation = offspring_traits.get('genetic_variation', {})
+                
+                if genetic_variation:
+                    # Apply speed variation
+                    if 'speed' in genetic_variation:
+                        speed_modifier = genetic_variation['speed']
+                        base_speed = offspring_traits.get('speed', 3)
+                        new_speed = int(base_speed * (1.0 + speed_modifier))
+                        new_speed = max(1, min(5, new_speed))  # Clamp to 1-5
+                        offspring_traits['speed'] = new_speed
+                    
+                    # Apply color variation
+                    if 'color' in genetic_variation and genetic_variation['color'] == 'varied':
+                        colors = ['blue', 'red', 'green', 'yellow', 'purple', 'orange', 'pink', 'cyan', 'brown', 'black', 'white']
+                        offspring_traits['color'] = random.choice(colors)
+                    
+                    # Apply strength variation (affects starting energy)
+                    strength_modifier = genetic_variation.get('strength', 0.0)
+                
+                # Generate offspring name based on parent names
+                offspring_name = f"{creature.name}'s Offspring"
+                new_creature = _STAGE_CLASSES[creature.stage](
+                    creature_id=self._resource_id_counter,
+                    traits=offspring_traits,
+                    x=new_x,
+                    y=new_y,
+                    player_id=creature.player_id,
+                    name=offspring_name
+                )
+                
+                # Apply starting energy with strength modifier
+                base_energy = 50
+                if genetic_variation and 'strength' in genetic_variation:
+                    base_energy = int(base_energy * (1.0 + genetic_variation['strength']))
+                new_creature.energy = base_energy
+                # Reproduction cost scales with stage (higher stage = more efficient)
+                reproduce_cost = max(40, 50 - (creature.stage - 1) * 5)
+                # Both creatures lose energy
+                creature.energy -= reproduce_cost
+                other_creature.energy -= reproduce_cost
+                # Track energy event: reproduce action, no object, -reproduce_cost energy
+                self.energy_events.add(('reproduce', None, -reproduce_cost))
+                self.add_cell(new_creature)
+                ctx.occupancy.setdefault((new_x, new_y), []).append(new_creature)
+                self._resource_id_counter += 1
+                ctx.events.append(f"{stage_name} {creature.name} and {other_creature.name} reproduced at ({new_x}, {new_y})")
+                ctx.detailed_events.append({
+                    'creature_id': creature.id,
+                    'type': 'reproduce',
+                    'location': (new_x, new_y),
+                    'offspring_id': new_creature.id,
+                    'partner_id': other_creature.id
+                })
+                reproduction_success = True
+                logger.debug("Turn %s: %s successfully reproduced with %s, created offspring %s", self.turn, creature.name, other_creature.name, new_creature.name)
+                break
+        
+        # If no free space found for offspring
+        if not reproduction_success:
+            logger.debug("Turn %s: %s reproduction failed - no free space for offspring", self.turn, creature.name)
+            ctx.events.append(f"{stage_name} {creature.name} and {other_creature.name} tried to reproduce but no space available")
+
+    def _do_signal(self, creature, action, pos_x, pos_y, stage_name, ctx):
+        """Handle a 'signal' action."""
+        # Signal action - communicate with nearby creatures of same player
+        nearby_allies = [c for c in self.cells 
+                       if c.id != creature.id and c.alive and c.player_id == creature.player_id
+                       and abs(c.x - pos_x) <= 3 and abs(c.y - pos_y) <= 3]
+        
+        if nearby_allies:
+            # Use social system to record communication
+            ally_ids = [c.id for c in nearby_allies]
+            self.social_system.communicate(creature.id, 'signal', ally_ids)
+            
+            ctx.events.append(f"{stage_name} {creature.name} signaled {len(nearby_allies)} nearby allies")
+            ctx.detailed_events.append({
+                'creature_id': creature.id,
+                'type': 'signal',
+                'allies_count': len(nearby_allies)
+            })
+        else:
+            logger.debug("Turn %s: %s signaled but no allies nearby", self.turn, creature.name)
+
+    def _do_claim(self, creature, action, pos_x, pos_y, stage_name, ctx):
+        """Handle a 'claim' action."""
+        # Claim territory action - claim current area
+        region_x = pos_x // self.region_size
+        region_y = pos_y // self.region_size
+        region_key = (region_x, region_y)
+        
+        # Use territory manager
+        if self.territory_manager.claim_territory(region_key, creature.id):
+            ctx.events.append(f"{stage_name} {creature.name} claimed territory at region ({region_x}, {region_y})")
+            ctx.detailed_events.append({
+                'creature_id': creature.id,
+                'type': 'claim',
+                'region': region_key
+            })
+        else:
+            ctx.events.append(f"{stage_name} {creature.name} tried to claim territory but it's already claimed")
+
+    def _do_cooperate(self, creature, action, pos_x, pos_y, stage_name, ctx):
+        """Handle a 'cooperate' action."""
+        # Cooperate action - share resources or work together
+        target_id = action.get('target_id')
+        target_creature = None
+        
+        if target_id:
+            target_creature = self.cells_by_id.get(target_id)
+            if target_creature is not None and not target_creature.alive:
+                target_creature = None
+        else:
+            # Find nearest ally
+            for other in self.cells:
+                if other.id != creature.id and other.alive and other.player_id == creature.player_id:
+                    other_pos_x, other_pos_y = other.get_position()
+                    # Squared distance avoids a sqrt per candidate (2**2 = 4)
+                    dist_sq = (other_pos_x - pos_x)**2 + (other_pos_y - pos_y)**2
+                    if dist_sq <= 4:
+                        target_creature = other
+                        break
+        
+        if target_creature:
+            # Share energy (creature gives some energy to target)
+            share_amount = min(10, creature.energy // 4)
+            if share_amount > 0:
+                creature.energy -= share_amount
+                target_creature.energy = min(100, target_creature.energy + share_amount)
+                ctx.events.append(f"{stage_name} {creature.name} cooperated with {target_creature.name}, shared {share_amount} energy")
+                ctx.detailed_events.append({
+                    'creature_id': creature.id,
+                    'type': 'cooperate',
+                    'target_id': target_creature.id,
+                    'energy_shared': share_amount
+                })
+                self.energy_events.add(('cooperate', f"creature_{target_creature.id}", -share_amount))
+        else:
+            logger.debug("Turn %s: %s tried to cooperate but no valid target", self.turn, creature.name)
+
+    def _do_migrate(self, creature, action, pos_x, pos_y, stage_name, ctx):
+        """Handle a 'migrate' action."""
+        # Migrate action - move toward resource-rich area
+        rich_areas = self.resource_manager.get_resource_rich_areas(creature)
+        
+        if rich_areas:
+            # Move toward richest area
+            target_x, target_y, _ = rich_areas[0]
+            dx = 1 if target_x > pos_x else (-1 if target_x < pos_x else 0)
+            dy = 1 if target_y > pos_y else (-1 if target_y < pos_y else 0)
+            
+            new_x = max(0, min(ctx.max_x, pos_x + dx))
+            new_y = max(0, min(ctx.max_y, pos_y + dy))
+            
+            # Check collision
+            collision = self._is_occupied(ctx.occupancy, new_x, new_y, exclude=creature)
+            
+            if not collision:
+                self._relocate(ctx.occupancy, creature, new_x, new_y)
+                # Migration cost scales with speed (faster creatures migrate more efficiently)
+                migrate_cost = max(0.5, 1.0 - (creature.speed - 3) * 0.2)
+                migrate_cost = int(migrate_cost) if migrate_cost >= 1.0 else 1
+                creature.energy -= migrate_cost
+                self.energy_events.add(('migrate', None, -migrate_cost))
+                ctx.events.append(f"{stage_name} {creature.name} migrated toward resource-rich area ({new_x}, {new_y})")
+                ctx.detailed_events.append({
+                    'creature_id': creature.id,
+                    'type': 'migrate',
+                    'location': (new_x, new_y)
+                })
+        else:
+            # No rich areas found, just move randomly
+            direction = random.choice([(0, -1), (0, 1), (-1, 0), (1, 0)])
+            new_x = max(0, min(ctx.max_x, pos_x + direction[0]))
+            new_y = max(0, min(ctx.max_y, pos_y + direction[1]))
+            self._relocate(ctx.occupancy, creature, new_x, new_y)
+            creature.energy -= 1
+
     def get_energy_events_list(self):
         """
         Get list of unique energy events formatted as strings.
@@ -1023,6 +1200,12 @@ class World:
             List of strings in format: "action object energy_change"
             Example: ["eat apple +30", "eat banana -20", "move -1"]
         """
+        # The set only grows until it is replaced by reset_energy_events, so the same
+        # set object with the same size means nothing changed since the last call
+        cached_events, cached_size, cached_result = self._energy_events_cache
+        if cached_events is self.energy_events and cached_size == len(self.energy_events):
+            return list(cached_result)
+        
         result = []
         # Sort with custom key that handles None values
         # Convert None to empty string for sorting purposes
@@ -1033,7 +1216,8 @@ class World:
                 result.append(f"{action} {obj} {sign}{energy_change}")
             else:
                 result.append(f"{action} {sign}{energy_change}")
-        return result
+        self._energy_events_cache = (self.energy_events, len(self.energy_events), result)
+        return list(result)
     
     def reset_energy_events(self):
         """Reset energy events tracker (called when starting new attempt)."""
@@ -85,6 +85,7 @@ async def shutdown():
     """Clean up on shutdown."""
     await llm_manager.close()
     await llm_parser.close()
+    await sprite_generator.close()
     print("LLM Managers closed")
 
 
@@ -108,6 +109,7 @@ def cleanup_user_sprites():
             print(f"[cleanup_user_sprites] Failed to remove {sprite_file}: {e}")
     
     if removed_count > 0:
+        sprite_generator.invalidate_sprite_cache()
         print(f"[cleanup_user_sprites] Removed {removed_count} sprite file(s)")
 
 
@@ -639,8 +641,8 @@ def build_initial_world_state(simulation, stage_controller):
     
     # Get territory data
     territories_data = {}
-    for region_key, territory in world.territory_manager.territories.items():
-        territories_data[f"{region_key[0]},{region_key[1]}"] = territory.owner_id
+    for region_key, owner_id in world.territory_manager.get_territory_owners().items():
+        territories_data[f"{region_key[0]},{region_key[1]}"] = owner_id
     
     # Get disasters data
     disasters_data = []
@@ -129,10 +129,10 @@ async def generate_test_sprite():
     generator = SpriteGenerator()
     
     try:
-        # Test placeholder generation
-        sprite_data = generator._create_placeholder_sprite(999, 1)
+        # Test placeholder generation (prompt hashes are hex strings)
+        sprite_data = generator._create_placeholder_sprite("999", 1)
         if sprite_data:
-            sprite_path = generator._get_sprite_path(999, 1)
+            sprite_path = generator._get_sprite_path("999", 1)
             async with aiofiles.open(sprite_path, 'wb') as f:
                 await f.write(sprite_data)
             print(f"✓ Test sprite created: {sprite_path}")